@@ -7,12 +7,170 @@ without code changes.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from datetime import date, time as dt_time
+from decimal import Decimal
+import atexit
+import functools
+import json
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Number of write operations sent per bulk_write round-trip
+BULK_BATCH_SIZE = 1000
+# Suggested mask_field marker_field: array listing which fields of a document were masked
+MASK_MARKER_FIELD = '_masked_fields'
+# Distinct values remembered per mask_field call (PII columns repeat a lot)
+MASK_CACHE_SIZE = 100_000
+# IDs per $in / ANY() query in find_by_ids (keeps queries well under 16MB)
+FIND_BY_IDS_CHUNK_SIZE = 5000
+# Seconds collection stats are served from cache (dashboards poll them)
+STATS_CACHE_TTL = 30
+# Concurrent $collStats aggregations when stats are refreshed
+STATS_MAX_WORKERS = 16
+
+# Driver-level pool settings; callers can override any of them via connect(**options)
+MONGO_POOL_OPTIONS = {
+    'maxPoolSize': 100,
+    'minPoolSize': 10,
+    'waitQueueTimeoutMS': 2000,
+}
+PG_POOL_MIN_CONN = 1
+PG_POOL_MAX_CONN = 20
+
+# Scalars psycopg2 adapts as-is; other non-nested values (ObjectId, Decimal128, ...) are sent as str
+PG_NATIVE_TYPES = (str, int, float, date, dt_time, Decimal)
+
+# PostgreSQL inserts switch from multi-VALUES INSERT to COPY at this batch size
+PG_COPY_THRESHOLD = 10_000
+# Stay under PostgreSQL's 65535 bind-parameter limit per statement
+PG_MAX_PARAMS = 65_000
+
+# BSON $type names mapped to FieldSchema.type values
+BSON_TYPE_MAP = {
+    'bool': 'boolean',
+    'int': 'integer',
+    'long': 'integer',
+    'double': 'float',
+    'decimal': 'float',
+    'string': 'string',
+    'object': 'object',
+    'array': 'array',
+    'objectId': 'objectid',
+    'date': 'date',
+}
+
+# Shared clients/pools keyed by connection string and options, so adapters
+# pointing at the same database reuse one warm connection pool
+_CLIENT_CACHE: Dict[Tuple, Any] = {}
+_PG_POOLS: Dict[Tuple, Any] = {}
+_POOL_LOCK = threading.Lock()
+
+# Connected adapters handed out by get_adapter, keyed by (database type, connection string)
+_SHARED_ADAPTERS: Dict[Tuple[str, str], 'DataAdapter'] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _python_type_map() -> Dict[type, str]:
+    """Exact Python/BSON value types mapped to FieldSchema.type values"""
+    from datetime import datetime
+    from bson import ObjectId
+    
+    return {
+        bool: 'boolean',
+        int: 'integer',
+        float: 'float',
+        str: 'string',
+        dict: 'object',
+        list: 'array',
+        ObjectId: 'objectid',
+        datetime: 'date',
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _check_c_extensions() -> None:
+    """Warn once if pymongo/bson are running without their C extensions"""
+    import bson
+    import pymongo
+    
+    if not (bson.has_c() and pymongo.has_c()):
+        logger.warning("pymongo C extensions not installed — BSON codec will be ~5-10x slower")
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _wrap_update(update: Dict) -> Dict:
+    """Wrap a plain field dict in $set; pass operator documents ($inc, ...) through"""
+    if update and next(iter(update)).startswith('$'):
+        return update
+    return {'$set': update}
+
+
+def _memoize_mask(mask_fn):
+    """Wrap mask_fn with an LRU cache, falling back for unhashable values"""
+    cached = functools.lru_cache(maxsize=MASK_CACHE_SIZE)(mask_fn)
+    
+    def masked(value):
+        try:
+            return cached(value)
+        except TypeError:
+            return mask_fn(value)
+    
+    return masked
+
+
+def _json_dumps(value: Any) -> str:
+    """JSON-encode a nested value for PostgreSQL (datetimes, ObjectIds etc. as str)"""
+    return json.dumps(value, default=str)
+
+
+def _pg_value(value: Any) -> Any:
+    """
+    Convert a document value for a PostgreSQL insert (shared by the VALUES and COPY paths)
+    
+    None, dicts/lists (stored as JSON) and PG_NATIVE_TYPES pass through;
+    anything else is converted with str().
+    """
+    if value is None or isinstance(value, (dict, list, PG_NATIVE_TYPES)):
+        return value
+    return str(value)
+
+
+def _pool_key(connection_string: str, options: Dict) -> Tuple:
+    """Build a hashable cache key from a connection string and its options"""
+    return (connection_string, tuple(sorted((k, repr(v)) for k, v in options.items())))
+
+
+def _close_pools() -> None:
+    """Close all shared clients and pools (registered to run at exit)"""
+    with _POOL_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+        for pool in _PG_POOLS.values():
+            pool.closeall()
+        _PG_POOLS.clear()
+
+
+atexit.register(_close_pools)
+
 
 @dataclass
 class DocumentSchema:
@@ -41,6 +199,29 @@ class DataAdapter(ABC):
     inherit from this class and implement all abstract methods.
     """
     
+    def __init__(self):
+        # (collection, sample_size) -> (collection version, DocumentSchema)
+        self._schema_cache: Dict[Tuple[str, int], Tuple[Any, DocumentSchema]] = {}
+        # collection -> (fetched_at, stats)
+        self._stats_cache: Dict[str, Tuple[float, Dict]] = {}
+        # Adapters are shared across threads by get_adapter; guards both caches
+        self._cache_lock = threading.Lock()
+    
+    def _evict_shared(self) -> None:
+        """Drop this adapter from get_adapter's shared cache (called on disconnect)"""
+        with _POOL_LOCK:
+            for key, adapter in list(_SHARED_ADAPTERS.items()):
+                if adapter is self:
+                    del _SHARED_ADAPTERS[key]
+    
+    def _invalidate(self, collection: str) -> None:
+        """Drop cached schemas and stats for a collection after a write"""
+        with self._cache_lock:
+            self._stats_cache.pop(collection, None)
+            for key in list(self._schema_cache):
+                if key[0] == collection:
+                    self._schema_cache.pop(key, None)
+    
     @abstractmethod
     def connect(self, connection_string: str, **options) -> None:
         """
@@ -99,13 +280,15 @@ class DataAdapter(ABC):
         pass
     
     @abstractmethod
-    def insert_documents(self, collection: str, documents: List[Dict]) -> int:
+    def insert_documents(self, collection: str, documents: List[Dict],
+                         fast: bool = False) -> int:
         """
         Insert multiple documents.
         
         Args:
             collection: Collection/table name
             documents: List of document dictionaries
+            fast: Trade durability for throughput (e.g. ephemeral test data)
         
         Returns:
             Number of documents inserted
@@ -128,7 +311,8 @@ class DataAdapter(ABC):
     
     @abstractmethod
     def find_documents(self, collection: str, query: Optional[Dict] = None, 
-                      limit: int = 0, skip: int = 0) -> List[Dict]:
+                      limit: int = 0, skip: int = 0,
+                      projection: Optional[Dict] = None) -> List[Dict]:
         """
         Query documents.
         
@@ -137,12 +321,34 @@ class DataAdapter(ABC):
             query: Query filter (None = all documents)
             limit: Maximum documents to return (0 = unlimited)
             skip: Number of documents to skip
+            projection: Optional fields to return
         
         Returns:
             List of matching documents
         """
         pass
     
+    @abstractmethod
+    def iter_documents(self, collection: str, query: Optional[Dict] = None,
+                       limit: int = 0, skip: int = 0,
+                       batch_size: int = 1000,
+                       projection: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Stream documents without materializing the full result set.
+        
+        Args:
+            collection: Collection/table name
+            query: Query filter (None = all documents)
+            limit: Maximum documents to return (0 = unlimited)
+            skip: Number of documents to skip
+            batch_size: Documents fetched per round-trip
+            projection: Optional fields to return
+        
+        Returns:
+            Iterator over matching documents
+        """
+        pass
+    
     @abstractmethod
     def find_one(self, collection: str, query: Dict) -> Optional[Dict]:
         """
@@ -157,6 +363,22 @@ class DataAdapter(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_ids(self, collection: str, ids: Iterable[Any],
+                    projection: Optional[Dict] = None) -> Dict[Any, Dict]:
+        """
+        Fetch many documents by primary key in as few queries as possible.
+        
+        Args:
+            collection: Collection/table name
+            ids: Primary key values to look up
+            projection: Optional fields to return
+        
+        Returns:
+            Dictionary mapping each found ID to its document
+        """
+        pass
+    
     @abstractmethod
     def count_documents(self, collection: str, query: Optional[Dict] = None) -> int:
         """
@@ -201,6 +423,21 @@ class DataAdapter(ABC):
         """
         pass
     
+    @abstractmethod
+    def update_many_bulk(self, collection: str,
+                         pairs: Iterable[Tuple[Dict, Dict]]) -> int:
+        """
+        Apply many single-document updates in batched round-trips.
+        
+        Args:
+            collection: Collection/table name
+            pairs: (query, update) tuples, one per document to update
+        
+        Returns:
+            Number of documents updated
+        """
+        pass
+    
     @abstractmethod
     def delete_documents(self, collection: str, query: Dict) -> int:
         """
@@ -230,13 +467,15 @@ class DataAdapter(ABC):
         pass
     
     @abstractmethod
-    def bulk_write(self, collection: str, operations: List[Dict]) -> Dict:
+    def bulk_write(self, collection: str, operations: List[Dict],
+                   fast: bool = False) -> Dict:
         """
         Execute bulk write operations.
         
         Args:
             collection: Collection/table name
             operations: List of write operations
+            fast: Trade durability for throughput (e.g. ephemeral test data)
         
         Returns:
             Summary of operations performed
@@ -255,6 +494,17 @@ class DataAdapter(ABC):
         """
         pass
     
+    @abstractmethod
+    def create_indexes(self, collection: str, specs: List[Dict]) -> None:
+        """
+        Create several single-field indexes in one request.
+        
+        Args:
+            collection: Collection/table name
+            specs: Index specs such as {'field': 'email', 'unique': True}
+        """
+        pass
+    
     @abstractmethod
     def get_collection_stats(self, collection: str) -> Dict:
         """
@@ -266,7 +516,19 @@ class DataAdapter(ABC):
         pass
     
     @abstractmethod
-    def mask_field(self, collection: str, field: str, mask_fn) -> int:
+    def get_all_collection_stats(self) -> Dict[str, Dict]:
+        """
+        Get statistics for every collection in the database.
+        
+        Returns:
+            Dictionary keyed by collection name, with the same per-collection
+            fields as get_collection_stats
+        """
+        pass
+    
+    @abstractmethod
+    def mask_field(self, collection: str, field: str, mask_fn,
+                   marker_field: Optional[str] = None) -> int:
         """
         Apply masking function to field across all documents.
         
@@ -274,6 +536,11 @@ class DataAdapter(ABC):
             collection: Collection/table name
             field: Field to mask
             mask_fn: Function that masks a value
+            marker_field: Opt-in array field (e.g. MASK_MARKER_FIELD) recording
+                which fields were already masked, so re-runs skip them. The
+                marker is written into every masked document, and a document
+                carrying it is never re-masked, even if the field was later
+                rewritten with real PII. None (default) masks every document.
         
         Returns:
             Number of documents masked
@@ -309,16 +576,29 @@ class MongoDBAdapter(DataAdapter):
     """MongoDB implementation of DataAdapter using pymongo"""
     
     def __init__(self):
+        super().__init__()
         self.client = None
         self.db = None
         self.connection_string = None
+        self._fast_wc = None
     
     def connect(self, connection_string: str, **options) -> None:
         """Connect to MongoDB"""
         from pymongo import MongoClient
+        from pymongo.write_concern import WriteConcern
+        
+        _check_c_extensions()
         
         try:
-            self.client = MongoClient(connection_string, **options)
+            # Write concern used by fast=True writes (unacknowledged by default)
+            self._fast_wc = WriteConcern(**options.pop('write_concern', {'w': 0, 'j': False}))
+            key = _pool_key(connection_string, options)
+            with _POOL_LOCK:
+                client = _CLIENT_CACHE.get(key)
+                if client is None:
+                    client = MongoClient(connection_string, **{**MONGO_POOL_OPTIONS, **options})
+                    _CLIENT_CACHE[key] = client
+            self.client = client
             # Extract database name from connection string
             db_name = connection_string.split('/')[-1].split('?')[0]
             if not db_name:
@@ -331,9 +611,11 @@ class MongoDBAdapter(DataAdapter):
             raise
     
     def disconnect(self) -> None:
-        """Close MongoDB connection"""
+        """Release MongoDB connection (the shared client pool stays warm)"""
+        self._evict_shared()
         if self.client:
-            self.client.close()
+            self.client = None
+            self.db = None
             logger.info("Disconnected from MongoDB")
     
     def health_check(self) -> bool:
@@ -365,39 +647,69 @@ class MongoDBAdapter(DataAdapter):
     def drop_collection(self, collection_name: str) -> None:
         """Drop MongoDB collection"""
         self.db[collection_name].drop()
+        self._invalidate(collection_name)
         logger.info(f"Dropped collection: {collection_name}")
     
     def list_collections(self) -> List[str]:
         """List all MongoDB collections"""
         return self.db.list_collection_names()
     
-    def insert_documents(self, collection: str, documents: List[Dict]) -> int:
+    def insert_documents(self, collection: str, documents: List[Dict],
+                         fast: bool = False) -> int:
         """Insert documents into MongoDB"""
         if not documents:
             return 0
-        result = self.db[collection].insert_many(documents)
+        if fast:
+            coll = self.db[collection].with_options(write_concern=self._fast_wc)
+            result = coll.insert_many(documents, ordered=False)
+        else:
+            result = self.db[collection].insert_many(documents)
+        self._invalidate(collection)
         logger.info(f"Inserted {len(result.inserted_ids)} documents into {collection}")
         return len(result.inserted_ids)
     
     def insert_one(self, collection: str, document: Dict) -> Any:
         """Insert single document into MongoDB"""
         result = self.db[collection].insert_one(document)
+        self._invalidate(collection)
         return result.inserted_id
     
     def find_documents(self, collection: str, query: Optional[Dict] = None,
-                      limit: int = 0, skip: int = 0) -> List[Dict]:
-        """Query MongoDB documents"""
+                      limit: int = 0, skip: int = 0,
+                      projection: Optional[Dict] = None, raw: bool = False) -> List[Dict]:
+        """Query MongoDB documents (raw=True returns lazily decoded RawBSONDocuments)"""
+        return list(self.iter_documents(collection, query, limit=limit, skip=skip,
+                                        projection=projection, raw=raw))
+    
+    def iter_documents(self, collection: str, query: Optional[Dict] = None,
+                       limit: int = 0, skip: int = 0,
+                       batch_size: int = 1000,
+                       projection: Optional[Dict] = None, raw: bool = False) -> Iterator[Dict]:
+        """Stream MongoDB documents from a batched cursor"""
         if query is None:
             query = {}
-        cursor = self.db[collection].find(query).skip(skip)
-        if limit > 0:
-            cursor = cursor.limit(limit)
-        return list(cursor)
+        coll = self.db[collection]
+        if raw:
+            # Skip building dicts; fields are decoded only when accessed
+            from bson.codec_options import CodecOptions
+            from bson.raw_bson import RawBSONDocument
+            coll = coll.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+        return coll.find(query, projection=projection,
+                         batch_size=batch_size).skip(skip).limit(max(limit, 0))
     
     def find_one(self, collection: str, query: Dict) -> Optional[Dict]:
         """Find single MongoDB document"""
         return self.db[collection].find_one(query)
     
+    def find_by_ids(self, collection: str, ids: Iterable[Any],
+                    projection: Optional[Dict] = None) -> Dict[Any, Dict]:
+        """Fetch MongoDB documents with one $in query per chunk of IDs"""
+        found = {}
+        for chunk in _chunked(ids, FIND_BY_IDS_CHUNK_SIZE):
+            for doc in self.db[collection].find({'_id': {'$in': chunk}}, projection=projection):
+                found[doc['_id']] = doc
+        return found
+    
     def count_documents(self, collection: str, query: Optional[Dict] = None) -> int:
         """Count MongoDB documents"""
         if query is None:
@@ -406,25 +718,51 @@ class MongoDBAdapter(DataAdapter):
     
     def update_documents(self, collection: str, query: Dict, update: Dict) -> int:
         """Update multiple MongoDB documents"""
-        result = self.db[collection].update_many(query, {'$set': update})
+        result = self.db[collection].update_many(query, _wrap_update(update))
+        self._invalidate(collection)
         return result.modified_count
     
     def update_one(self, collection: str, query: Dict, update: Dict) -> bool:
         """Update single MongoDB document"""
-        result = self.db[collection].update_one(query, {'$set': update})
+        result = self.db[collection].update_one(query, _wrap_update(update))
+        self._invalidate(collection)
         return result.modified_count > 0
     
+    def update_many_bulk(self, collection: str,
+                         pairs: Iterable[Tuple[Dict, Dict]]) -> int:
+        """Send per-document MongoDB updates as unordered bulk_write batches"""
+        from pymongo import UpdateOne
+        
+        coll = self.db[collection]
+        modified = 0
+        ops = []
+        
+        for query, update in pairs:
+            ops.append(UpdateOne(query, _wrap_update(update)))
+            if len(ops) >= BULK_BATCH_SIZE:
+                modified += coll.bulk_write(ops, ordered=False).modified_count
+                ops = []
+        
+        if ops:
+            modified += coll.bulk_write(ops, ordered=False).modified_count
+        
+        self._invalidate(collection)
+        return modified
+    
     def delete_documents(self, collection: str, query: Dict) -> int:
         """Delete multiple MongoDB documents"""
         result = self.db[collection].delete_many(query)
+        self._invalidate(collection)
         return result.deleted_count
     
     def delete_one(self, collection: str, query: Dict) -> bool:
         """Delete single MongoDB document"""
         result = self.db[collection].delete_one(query)
+        self._invalidate(collection)
         return result.deleted_count > 0
     
-    def bulk_write(self, collection: str, operations: List[Dict]) -> Dict:
+    def bulk_write(self, collection: str, operations: List[Dict],
+                   fast: bool = False) -> Dict:
         """Execute bulk write operations on MongoDB"""
         from pymongo import InsertOne, UpdateOne, DeleteOne
         
@@ -435,13 +773,25 @@ class MongoDBAdapter(DataAdapter):
             elif 'update_one' in op:
                 mongo_ops.append(UpdateOne(
                     op['update_one']['filter'],
-                    {'$set': op['update_one']['update']}
+                    _wrap_update(op['update_one']['update'])
                 ))
             elif 'delete_one' in op:
                 mongo_ops.append(DeleteOne(op['delete_one']))
         
         if mongo_ops:
-            result = self.db[collection].bulk_write(mongo_ops)
+            if fast:
+                coll = self.db[collection].with_options(write_concern=self._fast_wc)
+                result = coll.bulk_write(mongo_ops, ordered=False)
+            else:
+                result = self.db[collection].bulk_write(mongo_ops)
+            self._invalidate(collection)
+            if not result.acknowledged:
+                # Unacknowledged writes carry no server counts; report what was sent
+                return {
+                    'inserted': sum(isinstance(op, InsertOne) for op in mongo_ops),
+                    'updated': sum(isinstance(op, UpdateOne) for op in mongo_ops),
+                    'deleted': sum(isinstance(op, DeleteOne) for op in mongo_ops)
+                }
             return {
                 'inserted': result.inserted_count,
                 'updated': result.modified_count,
@@ -451,85 +801,216 @@ class MongoDBAdapter(DataAdapter):
     
     def create_index(self, collection: str, field_name: str, unique: bool = False) -> None:
         """Create index on MongoDB field"""
-        self.db[collection].create_index([(field_name, 1)], unique=unique)
-        logger.info(f"Created index on {collection}.{field_name}")
+        self.create_indexes(collection, [{'field': field_name, 'unique': unique}])
+    
+    def create_indexes(self, collection: str, specs: List[Dict]) -> None:
+        """Create MongoDB indexes with a single createIndexes command"""
+        from pymongo import IndexModel, ASCENDING
+        
+        if not specs:
+            return
+        models = [
+            IndexModel([(spec['field'], ASCENDING)], unique=spec.get('unique', False), background=True)
+            for spec in specs
+        ]
+        self.db[collection].create_indexes(models)
+        fields = ', '.join(spec['field'] for spec in specs)
+        logger.info(f"Created indexes on {collection}: {fields}")
     
     def get_collection_stats(self, collection: str) -> Dict:
         """Get MongoDB collection statistics"""
-        stats = self.db.command('collStats', collection)
+        return self._collection_stats([collection])[collection]
+    
+    def get_all_collection_stats(self) -> Dict[str, Dict]:
+        """Get statistics for all MongoDB collections"""
+        names = self.db.list_collection_names(filter={'type': 'collection'})
+        return self._collection_stats(names)
+    
+    def _collection_stats(self, collections: List[str]) -> Dict[str, Dict]:
+        """Fetch stats via $collStats, serving entries younger than STATS_CACHE_TTL from cache"""
+        now = time.monotonic()
+        
+        stats: Dict[str, Dict] = {}
+        stale = []
+        with self._cache_lock:
+            for collection in collections:
+                cached = self._stats_cache.get(collection)
+                if cached and now - cached[0] < STATS_CACHE_TTL:
+                    stats[collection] = cached[1]
+                else:
+                    stale.append(collection)
+        
+        fresh = self._fetch_stats(stale)
+        with self._cache_lock:
+            for collection, fetched in fresh.items():
+                self._stats_cache[collection] = (now, fetched)
+        stats.update(fresh)
+        
+        return {collection: stats[collection] for collection in collections}
+    
+    def _fetch_stats(self, collections: List[str]) -> Dict[str, Dict]:
+        """Read storage stats for collections from the server, in parallel"""
+        if not collections:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(STATS_MAX_WORKERS, len(collections))) as executor:
+            return dict(zip(collections, executor.map(self._storage_stats, collections)))
+    
+    def _storage_stats(self, collection: str) -> Dict:
+        """Sum one collection's $collStats storageStats over its shards"""
+        count = size = indexes = 0
+        for doc in self.db[collection].aggregate([{'$collStats': {'storageStats': {}}}]):
+            storage = doc.get('storageStats', {})
+            count += storage.get('count', 0)
+            size += storage.get('size', 0)
+            indexes = max(indexes, storage.get('nindexes', len(storage.get('indexSizes', {}))))
+        
         return {
-            'count': stats.get('count', 0),
-            'size': stats.get('size', 0),
-            'avg_doc_size': stats.get('avgObjSize', 0),
-            'indexes': len(stats.get('indexSizes', {}))
+            'count': count,
+            'size': size,
+            'avg_doc_size': size // count if count else 0,
+            'indexes': indexes
         }
     
-    def mask_field(self, collection: str, field: str, mask_fn) -> int:
+    def mask_field(self, collection: str, field: str, mask_fn,
+                   marker_field: Optional[str] = None) -> int:
         """Apply masking function to MongoDB field"""
-        docs = self.db[collection].find()
+        query = {field: {'$exists': True, '$ne': None}}
+        if marker_field:
+            query[marker_field] = {'$ne': field}
+        
+        masked = _memoize_mask(mask_fn)
+        docs = self.db[collection].find(
+            query,
+            projection={'_id': 1, field: 1},
+            batch_size=BULK_BATCH_SIZE,
+            no_cursor_timeout=True
+        )
         masked_count = 0
         
-        for doc in docs:
-            if field in doc and doc[field]:
-                masked_value = mask_fn(doc[field])
-                self.db[collection].update_one(
-                    {'_id': doc['_id']},
-                    {'$set': {field: masked_value}}
-                )
+        def _updates() -> Iterator[Tuple[Dict, Dict]]:
+            nonlocal masked_count
+            for doc in docs:
+                value = doc.get(field)
+                if not value:
+                    continue
+                update = {'$set': {field: masked(value)}}
+                if marker_field:
+                    update['$addToSet'] = {marker_field: field}
                 masked_count += 1
+                yield {'_id': doc['_id']}, update
+        
+        try:
+            self.update_many_bulk(collection, _updates())
+        finally:
+            docs.close()
         
         logger.info(f"Masked {masked_count} documents in {collection}.{field}")
         return masked_count
     
     def get_schema(self, collection: str, sample_size: int = 10) -> DocumentSchema:
-        """Infer MongoDB collection schema"""
-        from bson import ObjectId
+        """Infer MongoDB collection schema (cached until the collection changes)"""
+        version = self._collection_version(collection)
+        key = (collection, sample_size)
         
-        sample_docs = list(self.db[collection].find().limit(sample_size))
+        with self._cache_lock:
+            cached = self._schema_cache.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
         
-        if not sample_docs:
+        schema = self._infer_schema(collection, sample_size)
+        with self._cache_lock:
+            self._schema_cache[key] = (version, schema)
+        return schema
+    
+    def _collection_version(self, collection: str) -> Tuple[int, Any]:
+        """Cheap change token: metadata count plus the newest _id"""
+        coll = self.db[collection]
+        newest = coll.find_one(sort=[('_id', -1)], projection={'_id': 1})
+        return coll.estimated_document_count(), newest['_id'] if newest else None
+    
+    def _infer_schema(self, collection: str, sample_size: int) -> DocumentSchema:
+        """Infer schema server-side with an aggregation pipeline"""
+        from pymongo.errors import OperationFailure
+        
+        # Let the server sample and summarise BSON types per top-level field,
+        # so only one small document per field crosses the wire
+        pipeline = [
+            {'$sample': {'size': sample_size}},
+            {'$project': {'kv': {'$objectToArray': '$$ROOT'}}},
+            {'$unwind': '$kv'},
+            {'$group': {
+                '_id': '$kv.k',
+                'types': {'$addToSet': {'$type': '$kv.v'}},
+                'count': {'$sum': 1}
+            }}
+        ]
+        
+        try:
+            groups = list(self.db[collection].aggregate(pipeline, allowDiskUse=False))
+        except OperationFailure as e:
+            logger.warning(f"Schema aggregation failed on {collection}, sampling client-side: {e}")
+            return self._get_schema_from_samples(collection, sample_size)
+        
+        if not groups:
             return DocumentSchema(name=collection, fields={})
         
-        # Merge field info from all samples
+        # Every sampled document has an _id, so the largest count is the sample size
+        sampled = max(group['count'] for group in groups)
         field_info = {}
-        all_field_names = set()
-        
-        for doc in sample_docs:
-            all_field_names.update(doc.keys())
         
-        for field_name in all_field_names:
+        for group in groups:
+            field_name = group['_id']
             if field_name == '_id':
                 continue
             
-            types = set()
-            nullable = False
+            bson_types = group['types']
+            types = [BSON_TYPE_MAP.get(t, 'unknown') for t in bson_types if t != 'null']
             
-            for doc in sample_docs:
-                if field_name not in doc:
-                    nullable = True
-                else:
-                    value = doc[field_name]
-                    if isinstance(value, bool):
-                        types.add('boolean')
-                    elif isinstance(value, int):
-                        types.add('integer')
-                    elif isinstance(value, float):
-                        types.add('float')
-                    elif isinstance(value, str):
-                        types.add('string')
-                    elif isinstance(value, dict):
-                        types.add('object')
-                    elif isinstance(value, list):
-                        types.add('array')
-                    elif isinstance(value, ObjectId):
-                        types.add('objectid')
-            
-            field_type = list(types)[0] if types else 'unknown'
+            field_info[field_name] = FieldSchema(
+                name=field_name,
+                type=types[0] if types else 'unknown',
+                nullable=group['count'] < sampled or 'null' in bson_types
+            )
+        
+        return DocumentSchema(name=collection, fields=field_info)
+    
+    def _get_schema_from_samples(self, collection: str, sample_size: int) -> DocumentSchema:
+        """Infer schema by inspecting sampled documents in Python"""
+        from pymongo.errors import OperationFailure
+        
+        # $sample draws a random cursor in the storage engine instead of the
+        # (biased) first N documents; plain find() is the last resort
+        try:
+            sample_docs = list(self.db[collection].aggregate(
+                [{'$sample': {'size': sample_size}}], allowDiskUse=False
+            ))
+        except OperationFailure:
+            sample_docs = list(self.db[collection].find().limit(sample_size))
+        
+        if not sample_docs:
+            return DocumentSchema(name=collection, fields={})
+        
+        # Single pass over the samples: exact type() lookups instead of an
+        # isinstance ladder (which would also need care since bool is an int)
+        type_map = _python_type_map()
+        types_by_field: Dict[str, set] = {}
+        seen_by_field: Dict[str, int] = {}
+        
+        for doc in sample_docs:
+            for field_name, value in doc.items():
+                types_by_field.setdefault(field_name, set()).add(type_map.get(type(value)))
+                seen_by_field[field_name] = seen_by_field.get(field_name, 0) + 1
+        
+        field_info = {}
+        for field_name, types in types_by_field.items():
+            if field_name == '_id':
+                continue
             
+            types.discard(None)
             field_info[field_name] = FieldSchema(
                 name=field_name,
-                type=field_type,
-                nullable=nullable
+                type=next(iter(types)) if types else 'unknown',
+                nullable=seen_by_field[field_name] < len(sample_docs)
             )
         
         return DocumentSchema(name=collection, fields=field_info)
@@ -539,33 +1020,61 @@ class PostgreSQLAdapter(DataAdapter):
     """PostgreSQL implementation of DataAdapter using psycopg2"""
     
     def __init__(self):
-        self.connection = None
-        self.cursor = None
+        super().__init__()
+        self.pool = None
     
     def connect(self, connection_string: str, **options) -> None:
         """Connect to PostgreSQL"""
-        import psycopg2
+        from psycopg2.pool import ThreadedConnectionPool
         
         try:
-            self.connection = psycopg2.connect(connection_string)
-            self.cursor = self.connection.cursor()
+            key = _pool_key(connection_string, options)
+            with _POOL_LOCK:
+                pool = _PG_POOLS.get(key)
+                if pool is None:
+                    pool = ThreadedConnectionPool(
+                        options.pop('minconn', PG_POOL_MIN_CONN),
+                        options.pop('maxconn', PG_POOL_MAX_CONN),
+                        connection_string,
+                        **options
+                    )
+                    _PG_POOLS[key] = pool
+            self.pool = pool
             logger.info("Connected to PostgreSQL")
         except Exception as e:
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise
     
     def disconnect(self) -> None:
-        """Close PostgreSQL connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        """Release the PostgreSQL pool (it stays open for other adapters)"""
+        self._evict_shared()
+        if self.pool:
+            self.pool = None
             logger.info("Disconnected from PostgreSQL")
     
+    @contextmanager
+    def _connection(self):
+        """
+        Check a pooled connection out for one operation
+        
+        Commits when the block succeeds, rolls back when it raises, and
+        always returns the connection to the pool.
+        """
+        connection = self.pool.getconn()
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self.pool.putconn(connection)
+    
     def health_check(self) -> bool:
         """Verify PostgreSQL connectivity"""
         try:
-            self.cursor.execute("SELECT 1")
+            with self._connection() as connection, connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
             return True
         except Exception as e:
             logger.error(f"PostgreSQL health check failed: {e}")
@@ -574,8 +1083,9 @@ class PostgreSQLAdapter(DataAdapter):
     def validate_connection(self) -> Tuple[bool, str]:
         """Validate PostgreSQL connection"""
         try:
-            self.cursor.execute("SELECT version()")
-            version = self.cursor.fetchone()[0]
+            with self._connection() as connection, connection.cursor() as cursor:
+                cursor.execute("SELECT version()")
+                version = cursor.fetchone()[0]
             return True, f"Connected to {version}"
         except Exception as e:
             return False, f"PostgreSQL connection failed: {str(e)}"
@@ -591,19 +1101,145 @@ class PostgreSQLAdapter(DataAdapter):
     def list_collections(self) -> List[str]:
         pass
     
-    def insert_documents(self, collection: str, documents: List[Dict]) -> int:
-        pass
+    def insert_documents(self, collection: str, documents: List[Dict],
+                         fast: bool = False) -> int:
+        """Insert rows into PostgreSQL using execute_values, or COPY for large batches"""
+        from psycopg2 import sql
+        from psycopg2.extras import execute_values, Json
+        
+        if not documents:
+            return 0
+        
+        columns = list(documents[0].keys())
+        table = sql.Identifier(collection)
+        column_list = sql.SQL(", ").join(sql.Identifier(c) for c in columns)
+        
+        with self._connection() as connection, connection.cursor() as cursor:
+            if fast:
+                # Don't wait for the WAL flush on commit (this transaction only)
+                cursor.execute("SET LOCAL synchronous_commit TO OFF")
+            if len(documents) < PG_COPY_THRESHOLD:
+                statement = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(table, column_list)
+                rows = [
+                    tuple(Json(v, dumps=_json_dumps) if isinstance(v, (dict, list)) else v
+                          for v in (_pg_value(doc.get(c)) for c in columns))
+                    for doc in documents
+                ]
+                page_size = max(1, min(1000, PG_MAX_PARAMS // len(columns)))
+                execute_values(cursor, statement.as_string(connection), rows,
+                               page_size=page_size)
+            else:
+                statement = sql.SQL(
+                    "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+                ).format(table, column_list)
+                cursor.copy_expert(statement.as_string(connection),
+                                   self._to_csv(documents, columns))
+        
+        logger.info(f"Inserted {len(documents)} rows into {collection}")
+        return len(documents)
+    
+    @staticmethod
+    def _to_csv(documents: List[Dict], columns: List[str]):
+        """Serialize documents to an in-memory CSV buffer for COPY"""
+        import csv
+        import io
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for doc in documents:
+            row = []
+            for c in columns:
+                value = _pg_value(doc.get(c))
+                if value is None:
+                    value = '\\N'  # matches the NULL marker in the COPY statement
+                elif isinstance(value, (dict, list)):
+                    value = _json_dumps(value)
+                elif isinstance(value, bool):
+                    value = 't' if value else 'f'
+                row.append(value)
+            writer.writerow(row)
+        buffer.seek(0)
+        return buffer
     
     def insert_one(self, collection: str, document: Dict) -> Any:
         pass
     
     def find_documents(self, collection: str, query: Optional[Dict] = None,
-                      limit: int = 0, skip: int = 0) -> List[Dict]:
-        pass
+                      limit: int = 0, skip: int = 0,
+                      projection: Optional[Dict] = None) -> List[Dict]:
+        """Query PostgreSQL rows"""
+        return list(self.iter_documents(collection, query, limit=limit, skip=skip,
+                                        projection=projection))
+    
+    def iter_documents(self, collection: str, query: Optional[Dict] = None,
+                       limit: int = 0, skip: int = 0,
+                       batch_size: int = 1000,
+                       projection: Optional[Dict] = None) -> Iterator[Dict]:
+        """Stream PostgreSQL rows through a server-side (named) cursor"""
+        import uuid
+        from psycopg2 import sql
+        from psycopg2.extras import RealDictCursor
+        
+        where, params = self._where_clause(query)
+        statement = sql.SQL("SELECT {} FROM {}{} OFFSET %s").format(
+            self._select_columns(projection), sql.Identifier(collection), where
+        )
+        params.append(skip)
+        if limit > 0:
+            statement += sql.SQL(" LIMIT %s")
+            params.append(limit)
+        
+        # The connection stays checked out until the stream is exhausted or closed
+        with self._connection() as connection, connection.cursor(
+                name=f"iter_{uuid.uuid4().hex}", cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(statement, params)
+            for row in cursor:
+                yield dict(row)
+    
+    @staticmethod
+    def _select_columns(projection: Optional[Dict]) -> Any:
+        """Translate a projection dict into a column list (id is always included)"""
+        from psycopg2 import sql
+        
+        if not projection:
+            return sql.SQL("*")
+        wanted = ['id'] + [c for c, include in projection.items() if include and c != 'id']
+        return sql.SQL(", ").join(sql.Identifier(c) for c in wanted)
+    
+    @staticmethod
+    def _where_clause(query: Optional[Dict]) -> Tuple[Any, List]:
+        """Translate an equality-only query dict into a WHERE clause and params"""
+        from psycopg2 import sql
+        
+        if not query:
+            return sql.SQL(""), []
+        conditions = sql.SQL(" AND ").join(
+            sql.SQL("{} = %s").format(sql.Identifier(column)) for column in query
+        )
+        return sql.SQL(" WHERE ") + conditions, list(query.values())
     
     def find_one(self, collection: str, query: Dict) -> Optional[Dict]:
         pass
     
+    def find_by_ids(self, collection: str, ids: Iterable[Any],
+                    projection: Optional[Dict] = None) -> Dict[Any, Dict]:
+        """Fetch PostgreSQL rows with one id = ANY(...) query per chunk of IDs"""
+        from psycopg2 import sql
+        from psycopg2.extras import RealDictCursor
+        
+        statement = sql.SQL("SELECT {} FROM {} WHERE id = ANY(%s)").format(
+            self._select_columns(projection), sql.Identifier(collection)
+        )
+        
+        found = {}
+        with self._connection() as connection, connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            for chunk in _chunked(ids, FIND_BY_IDS_CHUNK_SIZE):
+                cursor.execute(statement, (chunk,))
+                for row in cursor:
+                    found[row['id']] = dict(row)
+        return found
+    
     def count_documents(self, collection: str, query: Optional[Dict] = None) -> int:
         pass
     
@@ -613,48 +1249,92 @@ class PostgreSQLAdapter(DataAdapter):
     def update_one(self, collection: str, query: Dict, update: Dict) -> bool:
         pass
     
+    def update_many_bulk(self, collection: str,
+                         pairs: Iterable[Tuple[Dict, Dict]]) -> int:
+        pass
+    
     def delete_documents(self, collection: str, query: Dict) -> int:
         pass
     
     def delete_one(self, collection: str, query: Dict) -> bool:
         pass
     
-    def bulk_write(self, collection: str, operations: List[Dict]) -> Dict:
+    def bulk_write(self, collection: str, operations: List[Dict],
+                   fast: bool = False) -> Dict:
         pass
     
     def create_index(self, collection: str, field_name: str, unique: bool = False) -> None:
         pass
     
+    def create_indexes(self, collection: str, specs: List[Dict]) -> None:
+        pass
+    
     def get_collection_stats(self, collection: str) -> Dict:
         pass
     
-    def mask_field(self, collection: str, field: str, mask_fn) -> int:
+    def get_all_collection_stats(self) -> Dict[str, Dict]:
+        pass
+    
+    def mask_field(self, collection: str, field: str, mask_fn,
+                   marker_field: Optional[str] = None) -> int:
         pass
     
     def get_schema(self, collection: str, sample_size: int = 10) -> DocumentSchema:
         pass
 
 
+_ADAPTER_CLASSES = {
+    'mongodb': MongoDBAdapter,
+    'postgresql': PostgreSQLAdapter,
+    # 'mysql': MySQLAdapter,
+    # 'dynamodb': DynamoDBAdapter,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter_class(database_type: str) -> type:
+    """Resolve an adapter class from a (case-insensitive) database type"""
+    adapter_class = _ADAPTER_CLASSES.get(database_type.lower())
+    if not adapter_class:
+        raise ValueError(f"Unknown database type: {database_type}")
+    return adapter_class
+
+
+def _adapter_for(database_type: str, connection_string: str) -> DataAdapter:
+    """Return the shared adapter for a database, creating and connecting it if needed"""
+    key = (database_type, connection_string)
+    with _POOL_LOCK:
+        adapter = _SHARED_ADAPTERS.get(key)
+    if adapter is not None:
+        return adapter
+    
+    adapter = _adapter_class(database_type)()
+    adapter.connect(connection_string)
+    with _POOL_LOCK:
+        # Another thread may have connected one meanwhile; keep the first
+        return _SHARED_ADAPTERS.setdefault(key, adapter)
+
+
 # Factory function to get the right adapter
-def get_adapter(database_type: str) -> DataAdapter:
+def get_adapter(database_type: str, connection_string: Optional[str] = None) -> DataAdapter:
     """
     Factory function to get database adapter.
     
     Args:
         database_type: 'mongodb', 'postgresql', 'mysql', etc.
+        connection_string: If given, return the shared, already connected
+            adapter for this database
     
     Returns:
-        DataAdapter implementation
+        DataAdapter implementation (unconnected if no connection_string)
+    
+    Every caller passing the same database_type and connection_string gets
+    the same adapter instance. Calling disconnect() on it evicts it from the
+    cache, so later get_adapter calls connect a fresh one, but it also
+    disconnects the instance for any caller still holding it. Only
+    disconnect a shared adapter when you own its whole lifetime; use
+    get_adapter(database_type) plus connect() for a private one.
     """
-    adapters = {
-        'mongodb': MongoDBAdapter,
-        'postgresql': PostgreSQLAdapter,
-        # 'mysql': MySQLAdapter,
-        # 'dynamodb': DynamoDBAdapter,
-    }
-    
-    adapter_class = adapters.get(database_type.lower())
-    if not adapter_class:
-        raise ValueError(f"Unknown database type: {database_type}")
-    
-    return adapter_class()
+    if connection_string is not None:
+        return _adapter_for(database_type.lower(), connection_string)
+    return _adapter_class(database_type)()
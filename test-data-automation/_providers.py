@@ -0,0 +1,103 @@
+"""
+Fake value providers for the MongoDB data factories
+
+Uses mimesis when it is installed, which is several times faster than
+Faker for names, emails and prose, and falls back to Faker otherwise.
+Both backends expose the same small interface, so the factories never
+branch on which one is in use.
+"""
+
+from typing import Optional
+from faker import Faker
+
+# mimesis is optional: Faker is always available as the fallback
+try:
+    from mimesis import Cryptographic, Internet, Person, Text
+    from mimesis.enums import Algorithm
+    from mimesis.locales import Locale
+except ImportError:
+    Person = None
+
+# mimesis text comes in sentences; roughly this many characters each
+MIMESIS_CHARS_PER_SENTENCE = 50
+
+
+class FakerProviders:
+    """Providers backed by a Faker instance"""
+    
+    def __init__(self, seed: Optional[int] = None):
+        self.faker = Faker()
+        if seed is not None:
+            self.faker.seed_instance(seed)
+    
+    def full_name(self) -> str:
+        return self.faker.name()
+    
+    def email(self) -> str:
+        return self.faker.email()
+    
+    def username(self) -> str:
+        return self.faker.user_name()
+    
+    def sha256(self) -> str:
+        return self.faker.sha256()
+    
+    def text(self, max_chars: int) -> str:
+        return self.faker.text(max_nb_chars=max_chars)
+    
+    def title(self, words: int) -> str:
+        return self.faker.sentence(nb_words=words).rstrip('.')
+    
+    def url(self) -> str:
+        return self.faker.url()
+    
+    def ipv4(self) -> str:
+        return self.faker.ipv4()
+    
+    def user_agent(self) -> str:
+        return self.faker.user_agent()
+
+
+class MimesisProviders:
+    """Providers backed by mimesis generators"""
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._person = Person(Locale.EN, seed=seed)
+        self._text = Text(Locale.EN, seed=seed)
+        self._internet = Internet(seed=seed)
+        self._crypto = Cryptographic(seed=seed)
+    
+    def full_name(self) -> str:
+        return self._person.full_name()
+    
+    def email(self) -> str:
+        return self._person.email()
+    
+    def username(self) -> str:
+        return self._person.username()
+    
+    def sha256(self) -> str:
+        return self._crypto.hash(Algorithm.SHA256)
+    
+    def text(self, max_chars: int) -> str:
+        quantity = max(1, max_chars // MIMESIS_CHARS_PER_SENTENCE)
+        return self._text.text(quantity=quantity)[:max_chars]
+    
+    def title(self, words: int) -> str:
+        return " ".join(self._text.words(quantity=words)).capitalize()
+    
+    def url(self) -> str:
+        return self._internet.url()
+    
+    def ipv4(self) -> str:
+        return self._internet.ip_v4()
+    
+    def user_agent(self) -> str:
+        return self._internet.user_agent()
+
+
+def make_providers(seed: Optional[int] = None):
+    """Return providers for the fastest available backend, optionally seeded"""
+    if Person is not None:
+        return MimesisProviders(seed)
+    return FakerProviders(seed)
@@ -5,21 +5,146 @@ Test Data Provisioning CLI Tool
 
 Usage:
   ista-data provision --datasets users,orders --volumes '{"users":100,"orders":500}'
-  ista-data status abc-123-def
+  ista-data status abc-123-def [--watch]
   ista-data cleanup abc-123-def
 """
 
 import click
+import hashlib
 import json
+import os
+import re
+import time
 import requests
 import yaml
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Optional
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# orjson is optional: faster and produces bytes directly for request bodies
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
 # Configuration
 API_ENDPOINT = "http://localhost:8000"
 LOG_LEVEL = "INFO"
 
+# Content type of the streamed /provision response
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Statuses after which `status --watch` stops polling
+TERMINAL_STATUSES = ('success', 'failed', 'expired')
+
+# Seconds `status --watch` polls before giving up on a request that never finishes
+WATCH_TIMEOUT = 600.0
+
+# Shared HTTP session so repeated calls reuse keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Rendered show-spec/list-datasets output, reused until the specs change
+RENDER_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ista" / "spec_render"
+
+
+def _load_spec(path: Path) -> dict:
+    """Load a data spec YAML with the C loader when available"""
+    return yaml.load(path.read_text(), Loader=_Loader)
+
+
+def _try_load_spec(path: Path) -> Optional[dict]:
+    """Load a data spec, returning None if it can't be read or parsed"""
+    try:
+        return _load_spec(path)
+    except Exception:
+        return None
+
+
+def _cached_render(name: str, version, render: Callable[[], str], refresh: bool = False) -> str:
+    """Return rendered text from the on-disk cache, rendering and storing it on a miss"""
+    cache_path = RENDER_CACHE_DIR / f"{name}.{version}.txt"
+    # Older renders of this name only: "users.<version>", not "users.archive.<version>"
+    stale_name = re.compile(rf"{re.escape(name)}\.[0-9a-f]+\.txt")
+    if not refresh:
+        try:
+            return cache_path.read_text()
+        except OSError:
+            pass
+    
+    text = render()
+    try:
+        RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in RENDER_CACHE_DIR.glob(f"{name}.*.txt"):
+            if stale_name.fullmatch(stale.name):
+                stale.unlink()
+        cache_path.write_text(text)
+    except OSError:
+        pass  # caching is best-effort
+    return text
+
+
+def _render_dataset_list(spec_dir: Path) -> str:
+    """Render the list-datasets output block"""
+    paths = sorted(spec_dir.glob("*.yaml"), key=lambda p: p.stem)
+    
+    # Read and parse specs concurrently so file I/O overlaps
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        specs = list(executor.map(_try_load_spec, paths))
+    
+    lines = [click.style("Available Datasets:", fg='cyan', bold=True)]
+    for path, spec in zip(paths, specs):
+        try:
+            description = spec.get('metadata', {}).get('description', 'No description')
+            volume = spec.get('spec', {}).get('volume', {}).get('count', 'Unknown')
+        except Exception:
+            lines.append(f"  • {path.stem}")
+            continue
+        lines.append(f"  • {click.style(path.stem, fg='green')}")
+        lines.append(f"    └─ {description} ({volume} rows)")
+    return "\n".join(lines) + "\n"
+
+
+def _read_provision_stream(response: requests.Response) -> Optional[dict]:
+    """Echo per-dataset events from an NDJSON provision stream; return the final summary"""
+    result = None
+    for line in response.iter_lines():
+        if not line:
+            continue
+        try:
+            event = _loads(line)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict):
+            raise click.ClickException(f"Malformed provision event: {line!r}")
+        
+        if 'record_counts' in event:
+            result = event
+        elif event.get('dataset') is None or event.get('count') is None:
+            raise click.ClickException(f"Provision event without dataset/count: {line!r}")
+        else:
+            click.echo(f"  ✓ {event.get('dataset')}: {event.get('count')} rows")
+    return result
+
+
 @click.group()
 @click.version_option("1.0.0")
 def cli():
@@ -32,7 +157,12 @@ def cli():
 @click.option('--mask/--no-mask', default=True, help='Apply PII masking')
 @click.option('--version', type=str, default='latest', help='Data spec version')
 @click.option('--ttl', type=int, default=120, help='Time to live (minutes)')
-def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int):
+@click.option('--fast/--durable', default=True,
+              help='Use unacknowledged writes for ephemeral data (default: fast)')
+@click.option('--async', 'run_async', is_flag=True,
+              help='Return the request ID immediately instead of waiting')
+def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int, fast: bool,
+              run_async: bool):
     """
     Provision test data.
     
@@ -47,6 +177,13 @@ def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int):
     
     # Without masking (for non-sensitive testing)
     $ ista-data provision --datasets products --no-mask
+    
+    # Acknowledged, journaled writes (slower)
+    $ ista-data provision --datasets users --durable
+    
+    # Start a long job and poll it separately
+    $ ista-data provision --datasets users --async
+    $ ista-data status <request-id> --watch
     """
     dataset_list = [d.strip() for d in datasets.split(',')]
     
@@ -67,7 +204,9 @@ def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int):
         "volumes": volumes_dict,
         "apply_masking": mask,
         "version": version,
-        "ttl_minutes": ttl
+        "ttl_minutes": ttl,
+        "fast_writes": fast,
+        "async": run_async
     }
     
     click.echo(click.style("📊 Provisioning test data...", fg='cyan'))
@@ -75,33 +214,53 @@ def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int):
     click.echo(f"  Volumes: {json.dumps(volumes_dict)}")
     click.echo(f"  Masking: {'Enabled' if mask else 'Disabled'}")
     click.echo(f"  TTL: {ttl} minutes")
+    click.echo(f"  Writes: {'Fast (unacknowledged)' if fast else 'Durable'}")
     click.echo()
     
     try:
-        response = requests.post(
+        # Servers that support it stream one NDJSON event per finished dataset
+        response = _SESSION.post(
             f"{API_ENDPOINT}/provision",
-            json=request_payload,
+            data=_dumps(request_payload),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": f"{NDJSON_CONTENT_TYPE}, application/json"
+            },
+            stream=True,
             timeout=300
         )
         
-        if response.status_code == 200:
-            result = response.json()
-            
-            click.echo(click.style("✓ Provisioning successful!", fg='green'))
-            click.echo(f"  Request ID: {click.style(result['request_id'], fg='bright_cyan')}")
-            click.echo(f"  Status: {result['status']}")
-            click.echo()
-            click.echo(click.style("  Records Provisioned:", fg='blue', bold=True))
-            for dataset, count in result['record_counts'].items():
-                click.echo(f"    • {dataset}: {click.style(str(count), fg='green')} rows")
-            
-            click.echo()
-            click.echo(f"  Expires at: {result['expires_at']}")
-            click.echo()
-            click.echo(click.style(f"  💾 Save request ID: {result['request_id']}", fg='yellow'))
-        else:
+        if response.status_code not in (200, 202):
             click.echo(click.style(f"✗ Provisioning failed: {response.text}", fg='red'), err=True)
             exit(1)
+        
+        if run_async:
+            result = _loads(response.content)
+            click.echo(click.style("✓ Provisioning started", fg='green'))
+            click.echo(f"  Request ID: {click.style(result['request_id'], fg='bright_cyan')}")
+            click.echo(f"  Follow progress: ista-data status {result['request_id']} --watch")
+            return
+        
+        if response.headers.get("Content-Type", "").startswith(NDJSON_CONTENT_TYPE):
+            result = _read_provision_stream(response)
+            if result is None:
+                click.echo(click.style("✗ Provisioning stream ended before completion", fg='red'), err=True)
+                exit(1)
+        else:
+            result = _loads(response.content)
+        
+        click.echo(click.style("✓ Provisioning successful!", fg='green'))
+        click.echo(f"  Request ID: {click.style(result['request_id'], fg='bright_cyan')}")
+        click.echo(f"  Status: {result['status']}")
+        click.echo()
+        click.echo(click.style("  Records Provisioned:", fg='blue', bold=True))
+        for dataset, count in result['record_counts'].items():
+            click.echo(f"    • {dataset}: {click.style(str(count), fg='green')} rows")
+        
+        click.echo()
+        click.echo(f"  Expires at: {result['expires_at']}")
+        click.echo()
+        click.echo(click.style(f"  💾 Save request ID: {result['request_id']}", fg='yellow'))
     
     except requests.exceptions.Timeout:
         click.echo(click.style("✗ Request timed out. Data may still be provisioning.", fg='yellow'), err=True)
@@ -111,28 +270,44 @@ def provision(datasets: str, volumes: str, mask: bool, version: str, ttl: int):
 
 @cli.command()
 @click.argument('request_id')
-def status(request_id: str):
+@click.option('--watch', is_flag=True, help='Poll until provisioning finishes')
+@click.option('--interval', type=float, default=2.0, help='Seconds between polls with --watch')
+@click.option('--timeout', type=click.FloatRange(min=0), default=WATCH_TIMEOUT, show_default=True,
+              help='Seconds to keep polling with --watch (0 = no limit)')
+def status(request_id: str, watch: bool, interval: float, timeout: float):
     """Check provisioning status"""
+    deadline = time.monotonic() + timeout if timeout else None
     try:
-        response = requests.get(f"{API_ENDPOINT}/provision/{request_id}")
-        
-        if response.status_code == 200:
-            result = response.json()
+        while True:
+            response = _SESSION.get(f"{API_ENDPOINT}/provision/{request_id}")
             
-            status_color = 'green' if result['status'] == 'success' else 'yellow'
-            click.echo(f"Status: {click.style(result['status'], fg=status_color)}")
-            click.echo(f"Datasets: {', '.join(result['datasets_provisioned'])}")
-            click.echo()
-            click.echo(click.style("Records:", fg='blue', bold=True))
-            for dataset, count in result['record_counts'].items():
-                click.echo(f"  • {dataset}: {count}")
+            if response.status_code != 200:
+                click.echo(click.style(f"✗ Request not found: {request_id}", fg='red'), err=True)
+                exit(1)
             
-            click.echo()
-            click.echo(f"Provisioned at: {result['provisioned_at']}")
-            click.echo(f"Expires at: {result['expires_at']}")
-        else:
-            click.echo(click.style(f"✗ Request not found: {request_id}", fg='red'), err=True)
-            exit(1)
+            result = _loads(response.content)
+            if not watch or result['status'] in TERMINAL_STATUSES:
+                break
+            
+            click.echo(f"Status: {click.style(result['status'], fg='yellow')}")
+            if deadline is not None and time.monotonic() + interval > deadline:
+                click.echo(click.style(
+                    f"✗ Still '{result['status']}' after {timeout:g}s; stopped watching", fg='red'
+                ), err=True)
+                exit(1)
+            time.sleep(interval)
+        
+        status_color = 'green' if result['status'] == 'success' else 'yellow'
+        click.echo(f"Status: {click.style(result['status'], fg=status_color)}")
+        click.echo(f"Datasets: {', '.join(result['datasets_provisioned'])}")
+        click.echo()
+        click.echo(click.style("Records:", fg='blue', bold=True))
+        for dataset, count in result['record_counts'].items():
+            click.echo(f"  • {dataset}: {count}")
+        
+        click.echo()
+        click.echo(f"Provisioned at: {result['provisioned_at']}")
+        click.echo(f"Expires at: {result['expires_at']}")
     
     except requests.exceptions.RequestException as e:
         click.echo(click.style(f"✗ Error: {str(e)}", fg='red'), err=True)
@@ -150,7 +325,7 @@ def cleanup(request_id: str, force: bool):
             return
     
     try:
-        response = requests.delete(f"{API_ENDPOINT}/provision/{request_id}")
+        response = _SESSION.delete(f"{API_ENDPOINT}/provision/{request_id}")
         
         if response.status_code == 200:
             click.echo(click.style(f"✓ Cleaned up {request_id}", fg='green'))
@@ -164,51 +339,47 @@ def cleanup(request_id: str, force: bool):
 
 @cli.command()
 @click.option('--dataset', type=str, required=True, help='Dataset name')
-def show_spec(dataset: str):
+@click.option('--refresh', is_flag=True, help='Re-render instead of using the cached output')
+def show_spec(dataset: str, refresh: bool):
     """Show data specification for dataset"""
     try:
-        with open(f"test-data-automation/data_definitions/{dataset}.yaml") as f:
-            spec = yaml.safe_load(f)
+        path = Path(f"test-data-automation/data_definitions/{dataset}.yaml")
+        rendered = _cached_render(
+            dataset,
+            path.stat().st_mtime_ns,
+            lambda: yaml.dump(_load_spec(path), default_flow_style=False, sort_keys=False),
+            refresh
+        )
         
         click.echo(click.style(f"Data Specification: {dataset}", fg='cyan', bold=True))
         click.echo("=" * 60)
-        click.echo(yaml.dump(spec, default_flow_style=False, sort_keys=False))
+        click.echo(rendered)
     
     except FileNotFoundError:
         click.echo(click.style(f"✗ Spec not found for dataset: {dataset}", fg='red'), err=True)
         exit(1)
 
 @cli.command()
-def list_datasets():
+@click.option('--refresh', is_flag=True, help='Re-render instead of using the cached output')
+def list_datasets(refresh: bool):
     """List available datasets"""
-    import os
-    from pathlib import Path
-    
     spec_dir = Path("test-data-automation/data_definitions")
     
     if not spec_dir.exists():
         click.echo(click.style("✗ Data definitions directory not found", fg='red'), err=True)
         return
     
-    datasets = [f.stem for f in spec_dir.glob("*.yaml")]
-    
-    click.echo(click.style("Available Datasets:", fg='cyan', bold=True))
-    for dataset in sorted(datasets):
-        try:
-            with open(spec_dir / f"{dataset}.yaml") as f:
-                spec = yaml.safe_load(f)
-                description = spec.get('metadata', {}).get('description', 'No description')
-                volume = spec.get('spec', {}).get('volume', {}).get('count', 'Unknown')
-                click.echo(f"  • {click.style(dataset, fg='green')}")
-                click.echo(f"    └─ {description} ({volume} rows)")
-        except Exception:
-            click.echo(f"  • {dataset}")
+    # Key the cached block on every spec's name and mtime
+    stamps = [(p.stem, p.stat().st_mtime_ns) for p in sorted(spec_dir.glob("*.yaml"))]
+    version = hashlib.sha1(repr(stamps).encode()).hexdigest()[:16]
+    click.echo(_cached_render("__list-datasets__", version,
+                              lambda: _render_dataset_list(spec_dir), refresh), nl=False)
 
 @cli.command()
 def health():
     """Check API health"""
     try:
-        response = requests.get(f"{API_ENDPOINT}/health", timeout=5)
+        response = _SESSION.get(f"{API_ENDPOINT}/health", timeout=5)
         
         if response.status_code == 200:
             click.echo(click.style("✓ API is healthy", fg='green'))
@@ -9,15 +9,32 @@ import click
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo import MongoClient, WriteConcern, InsertOne, ASCENDING
+from pymongo.errors import ConnectionFailure, OperationFailure, ServerSelectionTimeoutError
 import yaml
 import json
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import atexit
 import logging
+import shlex
+import threading
+
+from mongo_factories import (
+    MovieFactory, UserFactory, CommentFactory, SessionFactory, dumps
+)
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,6 +49,83 @@ YELLOW = "\033[93m"
 CYAN = "\033[96m"
 RESET = "\033[0m"
 
+# Connection pool ceiling; provision runs one worker per collection, each
+# with up to MAX_INFLIGHT_INSERTS inserts in flight
+MAX_POOL_SIZE = 64
+
+# Wire compression, in preference order; the driver skips codecs whose
+# module isn't installed and negotiates the rest with the server
+WIRE_COMPRESSORS = 'zstd,snappy,zlib'
+
+# Insert batches allowed in flight per collection while the next
+# batch is generated
+MAX_INFLIGHT_INSERTS = 16
+
+# Collections cleaned up concurrently
+MAX_CLEANUP_WORKERS = 16
+
+# Documents per insert batch; capped to stay well inside MongoDB's
+# 16MB message / 100k-operation bulk limits for typical documents
+MAX_BATCH_SIZE = 1000
+
+# Collection data definitions and the factory that generates each collection
+DEFINITIONS_DIR = Path(__file__).parent / "data_definitions" / "mongodb"
+
+FACTORY_MAP = {
+    'movies': MovieFactory,
+    'users': UserFactory,
+    'comments': CommentFactory,
+    'sessions': SessionFactory
+}
+
+# Progress bar redraws per second; updates between redraws are coalesced
+PROGRESS_REFRESH_PER_SECOND = 4
+
+# Long-lived MongoClients keyed by URI; closed at interpreter exit
+_CLIENTS: Dict[str, MongoClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _database_name(mongodb_uri: str) -> str:
+    """Database named in the URI path, ignoring query options; "test" if none"""
+    return urlsplit(mongodb_uri).path.lstrip('/') or "test"
+
+
+def _get_client(mongodb_uri: str) -> MongoClient:
+    """Return the shared MongoClient for a URI, creating and pinging it on first use"""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(mongodb_uri)
+        if client is None:
+            client = MongoClient(
+                mongodb_uri,
+                serverSelectionTimeoutMS=5000,
+                connectTimeoutMS=10000,
+                maxPoolSize=MAX_POOL_SIZE,
+                compressors=WIRE_COMPRESSORS,
+                zlibCompressionLevel=3
+            )
+            
+            # Verify connection before caching it
+            try:
+                client.admin.command('ping')
+            except Exception:
+                client.close()
+                raise
+            
+            _CLIENTS[mongodb_uri] = client
+    
+    return client
+
+
+@atexit.register
+def _close_clients():
+    """Close every cached MongoClient"""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
 
 class MongoDBClient:
     """Wrapper around MongoDB client for ISTA operations"""
@@ -52,19 +146,10 @@ class MongoDBClient:
             True if connection successful
         """
         try:
-            self.client = MongoClient(
-                mongodb_uri,
-                serverSelectionTimeoutMS=5000,
-                connectTimeoutMS=10000
-            )
-            
-            # Verify connection
-            self.client.admin.command('ping')
+            self.client = _get_client(mongodb_uri)
             
             # Extract database name
-            self.db_name = mongodb_uri.split('/')[-1].split('?')[0]
-            if not self.db_name:
-                self.db_name = "test"
+            self.db_name = _database_name(mongodb_uri)
             
             self.db = self.client[self.db_name]
             logger.info(f"Connected to MongoDB: {self.db_name}")
@@ -78,9 +163,15 @@ class MongoDBClient:
             return False
     
     def disconnect(self):
-        """Close MongoDB connection"""
+        """Close MongoDB connection and drop it from the shared client cache"""
         if self.client:
+            with _CLIENTS_LOCK:
+                for uri, client in list(_CLIENTS.items()):
+                    if client is self.client:
+                        del _CLIENTS[uri]
             self.client.close()
+            self.client = None
+            self.db = None
             logger.info("Disconnected from MongoDB")
     
     def health_check(self) -> bool:
@@ -92,8 +183,21 @@ class MongoDBClient:
             return False
 
 
-# Global MongoDB client
-mongo_client = MongoDBClient()
+def _connected_client(ctx, failure_message: str = "[red]Failed to connect to MongoDB[/red]") -> MongoDBClient:
+    """Return the CLI group's MongoDBClient, connecting it on first use; aborts if unavailable"""
+    client = ctx.obj['client']
+    
+    if client.db is None:
+        if not ctx.obj['mongodb_uri']:
+            console.print("[red]Error: MONGODB_URI not provided[/red]")
+            console.print("Set it via --mongodb-uri or MONGODB_URI environment variable")
+            raise click.Abort()
+        
+        if not client.connect(ctx.obj['mongodb_uri']):
+            console.print(failure_message)
+            raise click.Abort()
+    
+    return client
 
 
 @click.group()
@@ -116,6 +220,10 @@ def cli(ctx, mongodb_uri: str, verbose: bool):
     ctx.obj['mongodb_uri'] = mongodb_uri
     ctx.obj['verbose'] = verbose
     
+    # One client for the whole invocation (including every run-script step);
+    # it connects lazily so --help and bad-argument errors never touch the network
+    ctx.obj.setdefault('client', MongoDBClient())
+    
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -129,8 +237,18 @@ def cli(ctx, mongodb_uri: str, verbose: bool):
               help='Apply PII masking')
 @click.option('--clear', is_flag=True,
               help='Clear existing data before provisioning')
+@click.option('--truncate', is_flag=True,
+              help='With --clear, delete documents and keep indexes instead of dropping')
+@click.option('--durable', is_flag=True,
+              help='Journal inserts (j=True) instead of the faster unjournaled default')
+@click.option('--batch-size', type=click.IntRange(1, MAX_BATCH_SIZE, clamp=True),
+              default=MAX_BATCH_SIZE, show_default=True,
+              help=f'Documents per insert batch (max {MAX_BATCH_SIZE})')
+@click.option('--processes', type=click.IntRange(0), default=0, show_default=True,
+              help='Generate on a pool of N worker processes, one batch per worker at a time (0 = generate in this process)')
 @click.pass_context
-def provision(ctx, databases: tuple, volumes: Optional[str], mask: bool, clear: bool):
+def provision(ctx, databases: tuple, volumes: Optional[str], mask: bool, clear: bool,
+              truncate: bool, durable: bool, batch_size: int, processes: int):
     """
     Provision test data into MongoDB collections
     
@@ -142,120 +260,178 @@ def provision(ctx, databases: tuple, volumes: Optional[str], mask: bool, clear:
         # Provision with custom volumes
         ista provision -d users -d movies --volumes '{"users":100,"movies":500}'
     
-        # Clear and reprovision
+        # Clear and reprovision (drops the collection; spec indexes are rebuilt after every load)
         ista provision -d users --clear
-    """
-    mongodb_uri = ctx.obj['mongodb_uri']
     
-    if not mongodb_uri:
-        console.print("[red]Error: MONGODB_URI not provided[/red]")
-        console.print("Set it via --mongodb-uri or MONGODB_URI environment variable")
-        raise click.Abort()
+        # Clear but keep existing indexes
+        ista provision -d users --clear --truncate
+    
+        # Journaled inserts for data that must survive a crash
+        ista provision -d users --durable
     
+        # Smaller insert batches (e.g. for very large documents)
+        ista provision -d movies --batch-size 200
+    
+        # Generate large volumes in 8 worker processes
+        ista provision -d movies --volumes '{"movies":1000000}' --processes 8
+    
+    --processes is off by default. Its workers are spawned and re-import the
+    entry script, so a script that invokes the CLI in-process (e.g. through
+    CliRunner) must guard its entry point with `if __name__ == "__main__":`
+    before passing it; unguarded, every worker re-runs the script. If the
+    workers die, the remaining batches are generated in this process.
+    """
     # Connect to MongoDB
-    if not mongo_client.connect(mongodb_uri):
-        console.print("[red]Failed to connect to MongoDB[/red]", style="bold red")
+    mongo_client = _connected_client(ctx)
+    
+    # Parse volumes
+    volume_config = {}
+    if volumes:
+        try:
+            volume_config = json.loads(volumes)
+        except json.JSONDecodeError:
+            console.print("[red]Invalid volumes JSON[/red]")
+            raise click.Abort()
+    
+    # Load data definitions
+    if not DEFINITIONS_DIR.exists():
+        console.print(f"[red]Data definitions directory not found: {DEFINITIONS_DIR}[/red]")
         raise click.Abort()
     
-    try:
-        # Parse volumes
-        volume_config = {}
-        if volumes:
-            try:
-                volume_config = json.loads(volumes)
-            except json.JSONDecodeError:
-                console.print("[red]Invalid volumes JSON[/red]")
-                raise click.Abort()
+    # Test data skips journaling and schema validation unless asked to be durable
+    write_concern = WriteConcern(w=1, j=durable)
+    
+    # Rich progress rendering and console output are shared between workers
+    output_lock = threading.Lock()
+    
+    # Set once worker processes have failed; later batches generate in-process
+    processes_failed = threading.Event()
+    
+    def _provision_one(collection_name: str, progress: Progress) -> Optional[int]:
+        """Generate and insert one collection; returns documents created, or None if skipped"""
+        spec = _load_spec(collection_name)
         
-        # Load data definitions
-        def_dir = Path(__file__).parent / "data_definitions" / "mongodb"
+        if spec is None:
+            with output_lock:
+                progress.console.print(f"[yellow]Skipping {collection_name}: definition not found[/yellow]")
+            return None
         
-        if not def_dir.exists():
-            console.print(f"[red]Data definitions directory not found: {def_dir}[/red]")
-            raise click.Abort()
+        # Get volume
+        volume = volume_config.get(collection_name, 
+                                   spec['spec']['volume'].get('count', 100))
         
-        # Provision each collection
-        provisioned_count = 0
+        factory = FACTORY_MAP.get(collection_name)
+        if not factory:
+            with output_lock:
+                progress.console.print(f"[red]No factory for {collection_name}[/red]")
+            return None
         
-        for collection_name in databases:
-            spec_file = def_dir / f"{collection_name}.yaml"
-            
-            if not spec_file.exists():
-                console.print(f"[yellow]Skipping {collection_name}: definition not found[/yellow]")
-                continue
-            
-            with open(spec_file) as f:
-                spec = yaml.safe_load(f)
-            
-            # Get volume
-            volume = volume_config.get(collection_name, 
-                                       spec['spec']['volume'].get('count', 100))
-            
-            # Clear existing data if requested
-            if clear:
-                mongo_client.db[collection_name].delete_many({})
-                console.print(f"[yellow]Cleared {collection_name}[/yellow]")
-            
-            # Generate and insert documents
-            with Progress() as progress:
-                task = progress.add_task(
-                    f"[cyan]Provisioning {collection_name}...",
-                    total=volume
-                )
-                
-                # Import factory based on collection
-                from mongo_factories import (
-                    MovieFactory, UserFactory, CommentFactory, SessionFactory
+        # Clear existing data if requested
+        if clear:
+            _clear_collection(mongo_client.db, collection_name, truncate)
+            with output_lock:
+                progress.console.print(f"[yellow]Cleared {collection_name}[/yellow]")
+        
+        with output_lock:
+            task = progress.add_task(
+                f"[cyan]Provisioning {collection_name}...",
+                total=volume
+            )
+        
+        # Inserts run on a bounded pool so generating the next batch
+        # overlaps with batches already on the wire; the semaphore caps how
+        # many generated batches are waiting or in flight at once.
+        inflight = threading.BoundedSemaphore(MAX_INFLIGHT_INSERTS)
+        
+        target = mongo_client.db.get_collection(collection_name, write_concern=write_concern)
+        
+        # PII masking happens in the factory as documents are built
+        build_options = {'mask_pii': True} if mask and collection_name == 'users' else {}
+        
+        def _insert_batch(docs: list, batch_count: int) -> int:
+            try:
+                # bulk_write rather than insert_many so other op types can share the batch
+                result = target.bulk_write(
+                    [InsertOne(doc) for doc in docs],
+                    ordered=False, bypass_document_validation=True
                 )
-                
-                factory_map = {
-                    'movies': MovieFactory,
-                    'users': UserFactory,
-                    'comments': CommentFactory,
-                    'sessions': SessionFactory
-                }
-                
-                factory = factory_map.get(collection_name)
-                if not factory:
-                    console.print(f"[red]No factory for {collection_name}[/red]")
-                    continue
-                
-                # Generate documents in batches
-                batch_size = 100
-                docs_created = 0
-                
-                for batch_start in range(0, volume, batch_size):
-                    batch_end = min(batch_start + batch_size, volume)
-                    batch_count = batch_end - batch_start
-                    
-                    docs = factory.create_batch(batch_count)
-                    
-                    # Apply masking if requested
-                    if mask and collection_name == 'users':
-                        for doc in docs:
-                            if 'email' in doc:
-                                doc['email'] = _mask_email(doc['email'])
-                    
-                    # Insert batch
-                    result = mongo_client.db[collection_name].insert_many(docs)
-                    docs_created += len(result.inserted_ids)
-                    
-                    progress.update(task, advance=batch_count)
+            finally:
+                inflight.release()
             
-            # Get collection stats
-            stats = mongo_client.db.command('collStats', collection_name)
-            size_mb = stats['size'] / (1024 * 1024)
+            with output_lock:
+                progress.update(task, advance=batch_count)
+            return result.inserted_count
+        
+        def _generate(batch_count: int) -> list:
+            if processes and not processes_failed.is_set():
+                try:
+                    return factory.create_batch_parallel(batch_count, workers=processes, **build_options)
+                except BrokenProcessPool:
+                    with output_lock:
+                        if not processes_failed.is_set():
+                            processes_failed.set()
+                            progress.console.print(
+                                "[yellow]Worker processes failed; generating in-process[/yellow]"
+                            )
+            return factory.create_batch(batch_count, **build_options)
+        
+        # Generate documents in rounds of one batch per worker process, so a
+        # batch is never split across the pool again; without --processes a
+        # round is a single batch
+        round_size = batch_size * (processes or 1)
+        futures = []
+        
+        with ThreadPoolExecutor(max_workers=MAX_INFLIGHT_INSERTS) as insert_pool:
+            for round_start in range(0, volume, round_size):
+                docs = _generate(min(round_size, volume - round_start))
+                
+                # Insert the round batch by batch
+                for start in range(0, len(docs), batch_size):
+                    batch = docs[start:start + batch_size]
+                    inflight.acquire()
+                    futures.append(insert_pool.submit(_insert_batch, batch, len(batch)))
             
-            console.print(
-                f"[green]✓ {collection_name}:[/green] "
-                f"{docs_created} documents ({size_mb:.2f} MB)"
-            )
-            provisioned_count += docs_created
+            wait(futures)
         
-        console.print(f"\n[green bold]Total provisioned: {provisioned_count} documents[/green bold]")
-    
-    finally:
-        mongo_client.disconnect()
+        docs_created = sum(future.result() for future in futures)
+        
+        # Build the spec's indexes after the bulk load, which is cheaper than
+        # maintaining them during inserts. The collection may have been
+        # dropped here or by cleanup, and create_index is a no-op for an
+        # index that already exists, so this runs on every provision.
+        for failure in _create_spec_indexes(target, spec):
+            with output_lock:
+                progress.console.print(f"[yellow]{collection_name}: {failure}[/yellow]")
+        
+        return docs_created
+    
+    # Provision collections concurrently; each worker owns one collection, so
+    # a name repeated on the command line must not get a second worker
+    databases = list(dict.fromkeys(databases))
+    created = {}
+    
+    with _progress() as progress:
+        with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+            futures = {
+                executor.submit(_provision_one, collection_name, progress): collection_name
+                for collection_name in databases
+            }
+            for future in as_completed(futures):
+                docs_created = future.result()
+                if docs_created is not None:
+                    created[futures[future]] = docs_created
+    
+    # Collection stats for everything provisioned, fetched together at the end
+    stats = _collection_stats(mongo_client.db, [name for name in databases if name in created])
+    for collection_name, collection_stats in stats.items():
+        size_mb = collection_stats['size'] / (1024 * 1024)
+        console.print(
+            f"[green]✓ {collection_name}:[/green] "
+            f"{created[collection_name]} documents ({size_mb:.2f} MB)"
+        )
+    
+    provisioned_count = sum(created.values())
+    console.print(f"\n[green bold]Total provisioned: {provisioned_count} documents[/green bold]")
 
 
 @cli.command()
@@ -270,54 +446,42 @@ def status(ctx):
     
         ista status
     """
-    mongodb_uri = ctx.obj['mongodb_uri']
-    
-    if not mongodb_uri:
-        console.print("[red]Error: MONGODB_URI not provided[/red]")
-        raise click.Abort()
-    
-    if not mongo_client.connect(mongodb_uri):
-        console.print("[red]Failed to connect to MongoDB[/red]")
-        raise click.Abort()
-    
-    try:
-        table = Table(title=f"MongoDB Collections: {mongo_client.db_name}")
-        table.add_column("Collection", style="cyan", no_wrap=True)
-        table.add_column("Documents", style="magenta", justify="right")
-        table.add_column("Size (MB)", style="green", justify="right")
-        table.add_column("Avg Doc Size (B)", style="yellow", justify="right")
-        table.add_column("Indexes", style="blue", justify="right")
+    mongo_client = _connected_client(ctx)
+    
+    table = Table(title=f"MongoDB Collections: {mongo_client.db_name}")
+    table.add_column("Collection", style="cyan", no_wrap=True)
+    table.add_column("Documents", style="magenta", justify="right")
+    table.add_column("Size (MB)", style="green", justify="right")
+    table.add_column("Avg Doc Size (B)", style="yellow", justify="right")
+    table.add_column("Indexes", style="blue", justify="right")
+    
+    total_docs = 0
+    total_size = 0
+    
+    names = mongo_client.db.list_collection_names(filter={'type': 'collection'})
+    
+    for collection_name, stats in _collection_stats(mongo_client.db, names).items():
+        doc_count = stats['count']
+        size_bytes = stats['size']
+        size_mb = size_bytes / (1024 * 1024)
+        avg_doc_size = stats['avg_doc_size']
+        index_count = stats['indexes']
         
-        total_docs = 0
-        total_size = 0
-        
-        for collection_name in mongo_client.db.list_collection_names():
-            stats = mongo_client.db.command('collStats', collection_name)
-            
-            doc_count = stats.get('count', 0)
-            size_bytes = stats.get('size', 0)
-            size_mb = size_bytes / (1024 * 1024)
-            avg_doc_size = stats.get('avgObjSize', 0)
-            index_count = len(stats.get('indexSizes', {}))
-            
-            table.add_row(
-                collection_name,
-                str(doc_count),
-                f"{size_mb:.2f}",
-                str(int(avg_doc_size)),
-                str(index_count)
-            )
-            
-            total_docs += doc_count
-            total_size += size_mb
+        table.add_row(
+            collection_name,
+            str(doc_count),
+            f"{size_mb:.2f}",
+            str(int(avg_doc_size)),
+            str(index_count)
+        )
         
-        console.print(table)
-        console.print(f"\n[bold]Summary:[/bold]")
-        console.print(f"  Total Documents: {total_docs}")
-        console.print(f"  Total Size: {total_size:.2f} MB")
+        total_docs += doc_count
+        total_size += size_mb
     
-    finally:
-        mongo_client.disconnect()
+    console.print(table)
+    console.print(f"\n[bold]Summary:[/bold]")
+    console.print(f"  Total Documents: {total_docs}")
+    console.print(f"  Total Size: {total_size:.2f} MB")
 
 
 @cli.command()
@@ -325,12 +489,14 @@ def status(ctx):
               help='Collections to cleanup (all if not specified)')
 @click.option('--force', is_flag=True,
               help='Skip confirmation prompt')
+@click.option('--truncate', is_flag=True,
+              help='Delete documents and keep indexes instead of dropping collections')
 @click.pass_context
-def cleanup(ctx, collections: tuple, force: bool):
+def cleanup(ctx, collections: tuple, force: bool, truncate: bool):
     """
     Clean up test data from MongoDB
     
-    Deletes all documents from specified collections.
+    Drops the specified collections, or deletes their documents with --truncate.
     
     Examples:
     
@@ -342,47 +508,43 @@ def cleanup(ctx, collections: tuple, force: bool):
     
         # Skip confirmation
         ista cleanup --force
-    """
-    mongodb_uri = ctx.obj['mongodb_uri']
     
-    if not mongodb_uri:
-        console.print("[red]Error: MONGODB_URI not provided[/red]")
-        raise click.Abort()
+        # Keep collections and their indexes
+        ista cleanup -c users --truncate
+    """
+    mongo_client = _connected_client(ctx)
     
-    if not mongo_client.connect(mongodb_uri):
-        console.print("[red]Failed to connect to MongoDB[/red]")
-        raise click.Abort()
+    target_collections = list(collections) if collections else mongo_client.db.list_collection_names()
     
-    try:
-        target_collections = list(collections) if collections else mongo_client.db.list_collection_names()
+    if not force:
+        console.print(f"[yellow]Will delete data from:[/yellow]")
+        for c in target_collections:
+            console.print(f"  - {c}")
         
-        if not force:
-            console.print(f"[yellow]Will delete data from:[/yellow]")
-            for c in target_collections:
-                console.print(f"  - {c}")
-            
-            if not click.confirm("Continue?"):
-                console.print("[yellow]Cleanup cancelled[/yellow]")
-                return
+        if not click.confirm("Continue?"):
+            console.print("[yellow]Cleanup cancelled[/yellow]")
+            return
+    
+    with _progress() as progress:
+        task = progress.add_task("[cyan]Cleaning up...", total=len(target_collections))
         
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Cleaning up...", total=len(target_collections))
-            
-            for collection_name in target_collections:
-                result = mongo_client.db[collection_name].delete_many({})
-                console.print(f"[green]✓ {collection_name}:[/green] Deleted {result.deleted_count} documents")
+        # Drops and deletes are server-side, so run them for every collection at once
+        with ThreadPoolExecutor(max_workers=min(MAX_CLEANUP_WORKERS, len(target_collections) or 1)) as executor:
+            futures = {
+                executor.submit(_clear_collection, mongo_client.db, collection_name, truncate): collection_name
+                for collection_name in target_collections
+            }
+            for future in as_completed(futures):
+                console.print(f"[green]✓ {futures[future]}:[/green] {future.result()}")
                 progress.update(task, advance=1)
-        
-        console.print("[green bold]Cleanup complete[/green bold]")
     
-    finally:
-        mongo_client.disconnect()
+    console.print("[green bold]Cleanup complete[/green bold]")
 
 
 @cli.command()
 @click.option('--collection', '-c', required=True,
               help='Collection to query')
-@click.option('--limit', '-l', default=5,
+@click.option('--limit', '-l', type=click.IntRange(min=1), default=5,
               help='Number of documents to show')
 @click.pass_context
 def show(ctx, collection: str, limit: int):
@@ -395,34 +557,23 @@ def show(ctx, collection: str, limit: int):
     
         ista show -c movies --limit 3
     """
-    mongodb_uri = ctx.obj['mongodb_uri']
+    mongo_client = _connected_client(ctx)
     
-    if not mongodb_uri:
-        console.print("[red]Error: MONGODB_URI not provided[/red]")
-        raise click.Abort()
+    # One batch sized to the limit so the sample arrives in a single reply
+    docs = list(mongo_client.db[collection].find(projection=None, batch_size=limit).limit(limit))
     
-    if not mongo_client.connect(mongodb_uri):
-        console.print("[red]Failed to connect to MongoDB[/red]")
-        raise click.Abort()
+    if not docs:
+        console.print(f"[yellow]No documents found in {collection}[/yellow]")
+        return
     
-    try:
-        docs = list(mongo_client.db[collection].find().limit(limit))
-        
-        if not docs:
-            console.print(f"[yellow]No documents found in {collection}[/yellow]")
-            return
-        
-        console.print(f"[cyan]Sample documents from {collection}:[/cyan]\n")
-        
-        for i, doc in enumerate(docs, 1):
-            # Convert ObjectId to string for JSON serialization
-            json_str = json.dumps(doc, indent=2, default=str)
-            console.print(f"[bold cyan]Document {i}:[/bold cyan]")
-            console.print(json_str)
-            console.print()
+    console.print(f"[cyan]Sample documents from {collection}:[/cyan]\n")
     
-    finally:
-        mongo_client.disconnect()
+    for i, doc in enumerate(docs, 1):
+        # Convert ObjectId to string for JSON serialization
+        json_str = dumps(doc)
+        console.print(f"[bold cyan]Document {i}:[/bold cyan]")
+        console.print(json_str)
+        console.print()
 
 
 @cli.command()
@@ -437,40 +588,170 @@ def health(ctx):
     
         ista health
     """
-    mongodb_uri = ctx.obj['mongodb_uri']
+    mongo_client = _connected_client(ctx, "[red]✗ MongoDB connection failed[/red]")
     
-    if not mongodb_uri:
-        console.print("[red]Error: MONGODB_URI not provided[/red]")
-        raise click.Abort()
+    # Get server info
+    server_info = mongo_client.db.client.server_info()
+    
+    console.print("[green]✓ MongoDB connection healthy[/green]")
+    console.print(f"  Database: {mongo_client.db_name}")
+    console.print(f"  Version: {server_info.get('version', 'unknown')}")
+    console.print(f"  Collections: {len(mongo_client.db.list_collection_names())}")
+    
+    # Check Atlas if applicable
+    if 'mongodb+srv://' in ctx.obj['mongodb_uri']:
+        console.print("  Cluster: MongoDB Atlas")
+
+
+@cli.command('run-script')
+@click.argument('script', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.pass_context
+def run_script(ctx, script: Path):
+    """
+    Run several commands from a YAML script on one MongoDB connection
+    
+    Each step is a command line as it would follow `ista`:
+    
+    \b
+        steps:
+          - provision -d users -d movies --clear
+          - provision -d users --volumes '{"users":100}'
+          - status
+          - show -c users --limit 2
     
-    if mongo_client.connect(mongodb_uri):
+    Steps are split like a shell command line, so quote arguments that
+    contain spaces or JSON as you would in the shell. Steps that contain
+    ': ' or ' #' must also be quoted as a whole for YAML.
+    
+    Example:
+    
+        ista run-script nightly.yaml
+    """
+    with open(script) as f:
+        document = yaml.load(f, Loader=_Loader) or {}
+    
+    steps = document.get('steps', []) if isinstance(document, dict) else None
+    if not isinstance(steps, list):
+        raise click.BadParameter("expected a mapping with a 'steps' list", param_hint="SCRIPT")
+    
+    # Reject malformed steps before any of them runs
+    step_args = []
+    for i, step in enumerate(steps, 1):
+        if not isinstance(step, str):
+            raise click.BadParameter(
+                f"step {i} must be a command line string, not {type(step).__name__}",
+                param_hint="SCRIPT"
+            )
+        args = shlex.split(step)
+        if not args:
+            raise click.BadParameter(f"step {i} is empty", param_hint="SCRIPT")
+        step_args.append(args)
+    
+    for i, (step, args) in enumerate(zip(steps, step_args), 1):
+        cmd_name, cmd, args = cli.resolve_command(ctx.parent, args)
+        
+        if cmd is run_script:
+            console.print(f"[red]Step {i}: run-script cannot be nested[/red]")
+            raise click.Abort()
+        
+        console.print(f"[bold cyan]Step {i}: {step}[/bold cyan]")
+        with cmd.make_context(cmd_name, args, parent=ctx.parent) as sub_ctx:
+            cmd.invoke(sub_ctx)
+
+
+def _progress() -> Progress:
+    """Progress display with throttled redraws; rendering is disabled when output isn't a terminal"""
+    return Progress(
+        console=console,
+        refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+        disable=not console.is_terminal
+    )
+
+
+def _clear_collection(db, name: str, truncate: bool = False) -> str:
+    """
+    Empty a collection
+    
+    Dropping is a constant-time metadata operation but also removes indexes;
+    truncate deletes every document and keeps the collection and its indexes.
+    
+    Returns:
+        Summary of what was done, for display
+    """
+    if truncate:
+        result = db[name].delete_many({})
+        return f"Deleted {result.deleted_count} documents"
+    
+    db[name].drop()
+    return "Dropped collection"
+
+
+def _create_spec_indexes(collection, spec: Dict[str, Any]) -> List[str]:
+    """
+    Create the indexes listed in a collection spec's indexes section
+    
+    Each index is built on its own so one failure (e.g. a unique index over
+    generated duplicates) doesn't prevent the rest.
+    
+    Returns:
+        Messages for indexes that could not be created
+    """
+    failures = []
+    for index in spec['spec'].get('indexes', []):
         try:
-            # Get server info
-            server_info = mongo_client.db.client.server_info()
-            
-            console.print("[green]✓ MongoDB connection healthy[/green]")
-            console.print(f"  Database: {mongo_client.db_name}")
-            console.print(f"  Version: {server_info.get('version', 'unknown')}")
-            console.print(f"  Collections: {len(mongo_client.db.list_collection_names())}")
-            
-            # Check Atlas if applicable
-            if 'mongodb+srv://' in mongodb_uri:
-                console.print("  Cluster: MongoDB Atlas")
+            collection.create_index(
+                [(index['field'], ASCENDING)],
+                unique=index.get('unique', False)
+            )
+        except OperationFailure as e:
+            failures.append(f"index on {index['field']} not created: {e}")
+    
+    return failures
+
+
+def _collection_stats(db, names) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch storage stats for several collections at once
+    
+    $collStats only runs against a single collection, so the per-collection
+    aggregations are issued concurrently rather than one round trip at a time.
+    
+    Returns:
+        Stats keyed by collection name, in the order given
+    """
+    def _one(name: str) -> Dict[str, Any]:
+        # One document per shard; sum them for the collection total
+        count = size = indexes = 0
+        for doc in db[name].aggregate([{'$collStats': {'storageStats': {}}}]):
+            storage = doc.get('storageStats', {})
+            count += storage.get('count', 0)
+            size += storage.get('size', 0)
+            indexes = max(indexes, storage.get('nindexes', len(storage.get('indexSizes', {}))))
         
-        finally:
-            mongo_client.disconnect()
-    else:
-        console.print("[red]✗ MongoDB connection failed[/red]")
-        raise click.Abort()
+        return {
+            'count': count,
+            'size': size,
+            'avg_doc_size': size // count if count else 0,
+            'indexes': indexes
+        }
+    
+    names = list(names)
+    if not names:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_POOL_SIZE, len(names))) as executor:
+        return dict(zip(names, executor.map(_one, names)))
 
 
-def _mask_email(email: str) -> str:
-    """Mask email address"""
-    import re
-    match = re.match(r'(\w)(\w*)@(.+)', email)
-    if match:
-        return f"{match.group(1)}***@{match.group(3)}"
-    return "masked@example.com"
+@lru_cache(maxsize=None)
+def _load_spec(collection_name: str) -> Optional[Dict[str, Any]]:
+    """Load and cache a collection's YAML definition; None if it doesn't exist"""
+    spec_file = DEFINITIONS_DIR / f"{collection_name}.yaml"
+    if not spec_file.exists():
+        return None
+    
+    with open(spec_file) as f:
+        return yaml.load(f, Loader=_Loader)
 
 
 if __name__ == '__main__':
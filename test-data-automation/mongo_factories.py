@@ -5,13 +5,216 @@ Provides factory classes to generate realistic test data for MongoDB
 collections matching the sample_mflix schema structure.
 """
 
-from faker import Faker
 from bson import ObjectId
+from pymongo.collection import Collection
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import json
+import multiprocessing
+import os
 import random
+import re
+import threading
 
-fake = Faker()
+# NumPy is optional: when present, numeric fields are drawn a column at a time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is optional: a much faster encoder for dumping generated documents
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ._providers import make_providers
+except ImportError:
+    from _providers import make_providers
+
+# Name/email/text providers: mimesis when installed, otherwise Faker
+providers = make_providers()
+
+# Threads for the dataset helpers below
+DATASET_THREADS = 8
+
+# Documents create_iter and the dataset iterators generate per chunk
+DATASET_CHUNK_SIZE = 1000
+
+# Ids object_id_block can number from one prefix (its 3-byte counter range)
+OBJECT_ID_COUNTER_SPAN = 1 << 24
+
+# Precomputed offsets for the random date fields, indexed by day/hour count
+_DAY_DELTAS = tuple(timedelta(days=i) for i in range(366))
+_HOUR_DELTAS = tuple(timedelta(hours=i) for i in range(25))
+
+# Per-thread random state: numpy Generators and provider instances aren't
+# thread-safe, so each thread gets its own
+_thread_state = threading.local()
+
+
+def _numpy_rng():
+    """Return this thread's numpy random Generator"""
+    rng = getattr(_thread_state, 'rng', None)
+    if rng is None:
+        rng = _thread_state.rng = np.random.default_rng()
+    return rng
+
+
+def _thread_providers():
+    """
+    Providers for the calling thread
+    
+    The main thread uses the module-level providers; other threads get their
+    own, seeded from os.urandom, so concurrent builds don't share generator
+    state and a thread reusing an earlier thread's id doesn't replay its values.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return providers
+    
+    thread_providers = getattr(_thread_state, 'providers', None)
+    if thread_providers is None:
+        thread_providers = _thread_state.providers = make_providers(int.from_bytes(os.urandom(8), 'big'))
+    return thread_providers
+
+
+def _reseed(seed: int):
+    """Reseed every random source the factories draw from (used in worker processes)"""
+    global providers
+    providers = make_providers(seed)
+    random.seed(seed)
+    refresh_pools()
+    if np is not None:
+        _thread_state.rng = np.random.default_rng(seed)
+
+
+# Values per pre-generated pool; fields that need no per-document uniqueness
+# (names, prose, urls) are sampled from these instead of calling the providers each time
+VALUE_POOL_SIZE = 2048
+
+# How each value pool is filled from the providers
+_POOL_BUILDERS = {
+    "name": lambda p: p.full_name(),
+    "text100": lambda p: p.text(100),
+    "text200": lambda p: p.text(200),
+    "text500": lambda p: p.text(500),
+    "url": lambda p: p.url(),
+    "email": lambda p: p.email(),
+    "sha256": lambda p: p.sha256(),
+    "user_agent": lambda p: p.user_agent(),
+}
+
+_pools: Dict[str, List[str]] = {}
+_pools_lock = threading.Lock()
+
+
+def _pooled(name: str) -> str:
+    """Return a random value from the named pool, generating the pool on first use"""
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                build, p = _POOL_BUILDERS[name], _thread_providers()
+                pool = _pools[name] = [build(p) for _ in range(VALUE_POOL_SIZE)]
+    return random.choice(pool)
+
+
+def refresh_pools():
+    """Discard the value pools so the next builds draw fresh provider values"""
+    with _pools_lock:
+        _pools.clear()
+
+
+def dumps(doc: Dict[str, Any]) -> str:
+    """
+    Serialise a document as indented JSON
+    
+    Uses orjson when installed, which encodes datetimes and NumPy values
+    natively; anything else, such as ObjectId, is written as str(). The
+    factories build naive local datetimes, which are written without an
+    offset rather than stamped as UTC.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(doc, option=option, default=str).decode()
+    return json.dumps(doc, indent=2, default=str)
+
+
+# Email masking keeps the first character and the domain
+_EMAIL_RE = re.compile(r'(\w)\w*@(.+)')
+MASKED_EMAIL_FALLBACK = "masked@example.com"
+
+
+def mask_email(email: str) -> str:
+    """Mask email address"""
+    match = _EMAIL_RE.match(email)
+    if match:
+        return f"{match.group(1)}***@{match.group(2)}"
+    return MASKED_EMAIL_FALLBACK
+
+
+def object_id_block(count: int) -> List[ObjectId]:
+    """
+    Generate count ObjectIds sharing one timestamp and random prefix
+    
+    The 3-byte counter is incremented per id, so the ids of a block are
+    monotonic (better index locality on insert); its start is drawn low
+    enough that the counter never wraps inside the block. The prefix is
+    drawn fresh from os.urandom for every block, so there is no state for
+    threads to share or forked children to replay.
+    """
+    prefix = ObjectId().binary[:4] + os.urandom(5)
+    start = int.from_bytes(os.urandom(3), 'big') % max(1, OBJECT_ID_COUNTER_SPAN - count + 1)
+    return [ObjectId(prefix + (start + i).to_bytes(3, 'big')) for i in range(count)]
+
+
+# Worker process pools for create_batch_parallel, keyed by size and started on first use
+_PROCESS_POOLS: Dict[int, ProcessPoolExecutor] = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared pool of the given number of worker processes for create_batch_parallel
+    
+    Workers are spawned rather than forked: a forked worker would inherit the
+    parent's providers and random state, and any lock another thread
+    happened to hold at fork time.
+    """
+    with _PROCESS_POOLS_LOCK:
+        pool = _PROCESS_POOLS.get(workers)
+        if pool is None:
+            pool = _PROCESS_POOLS[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+    return pool
+
+
+def _discard_process_pool(workers: int, pool: ProcessPoolExecutor):
+    """Drop a broken pool from the cache so the next call starts a fresh one"""
+    with _PROCESS_POOLS_LOCK:
+        if _PROCESS_POOLS.get(workers) is pool:
+            del _PROCESS_POOLS[workers]
+    pool.shutdown(wait=False)
+
+
+class _BuildContext:
+    """State shared by the default field builders of one document"""
+    
+    __slots__ = ("cls", "providers", "numbers", "now", "doc")
+    
+    def __init__(self, cls, numbers: Optional[Dict[str, Any]], now: datetime):
+        self.cls = cls
+        self.providers = _thread_providers()
+        self.numbers = numbers
+        self.now = now
+        self.doc: Dict[str, Any] = {}
 
 
 class BaseFactory:
@@ -19,6 +222,9 @@ class BaseFactory:
     
     collection_name: str = "base"
     
+    # Field -> builder(context) for its default value, in document order
+    _DEFAULT_BUILDERS: Dict[str, Callable[[_BuildContext], Any]] = {}
+    
     @classmethod
     def create(cls, **overrides) -> Dict[str, Any]:
         """Create a single document with optional field overrides"""
@@ -27,13 +233,109 @@ class BaseFactory:
     
     @classmethod
     def create_batch(cls, count: int, **overrides) -> List[Dict[str, Any]]:
-        """Create multiple documents"""
-        return [cls.create(**overrides) for _ in range(count)]
+        """Create multiple documents (see create_iter to stream them instead)"""
+        return list(cls.create_iter(count, **overrides))
+    
+    @classmethod
+    def create_batch_parallel(cls, count: int, workers: Optional[int] = None,
+                              seed: Optional[int] = None, **overrides) -> List[Dict[str, Any]]:
+        """
+        Create multiple documents, sharding the work across worker processes
+        
+        The work is split into one shard per worker process. Shards run on a
+        shared pool of spawned processes (see _process_pool), each reseeding
+        the providers, random and NumPy with seed + shard index. A pool whose
+        workers died is dropped from the cache (BrokenProcessPool still
+        propagates), so the next call starts a fresh one.
+        Spawned workers re-import the calling script, so scripts that call
+        this must guard their entry point with `if __name__ == "__main__":`.
+        
+        Args:
+            count: Number of documents
+            workers: Worker processes (default: CPU count)
+            seed: Base seed (default: random)
+        
+        Returns:
+            Documents from all shards, in shard order
+        """
+        if count <= 0:
+            return []
+        
+        workers = workers or os.cpu_count() or 1
+        shards = min(workers, count)
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        
+        chunk, extra = divmod(count, shards)
+        sizes = [chunk + (1 if i < extra else 0) for i in range(shards)]
+        
+        pool = _process_pool(workers)
+        try:
+            futures = [
+                pool.submit(cls._build_chunk, size, seed + i, overrides)
+                for i, size in enumerate(sizes)
+            ]
+            return [doc for future in futures for doc in future.result()]
+        except BrokenProcessPool:
+            _discard_process_pool(workers, pool)
+            raise
+    
+    @classmethod
+    def _build_chunk(cls, count: int, seed: int, overrides: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build one create_batch_parallel shard in a worker process"""
+        _reseed(seed)
+        return cls.create_batch(count, **overrides)
+    
+    @classmethod
+    def create_iter(cls, count: int, **overrides) -> Iterator[Dict[str, Any]]:
+        """
+        Yield count documents lazily, using vectorised numeric fields when available
+        
+        Ids and numeric columns are drawn DATASET_CHUNK_SIZE documents at a
+        time, so memory stays flat however many documents are streamed.
+        """
+        # One clock read for the whole batch rather than several per document
+        overrides.setdefault("_now", datetime.now())
+        
+        fixed_id = "_id" in overrides
+        _id = overrides.pop("_id", None)
+        
+        for start in range(0, count, DATASET_CHUNK_SIZE):
+            size = min(DATASET_CHUNK_SIZE, count - start)
+            ids = itertools.repeat(_id, size) if fixed_id else object_id_block(size)
+            
+            rows = cls.numeric_rows(size) if np is not None else None
+            if rows is None:
+                for doc_id in ids:
+                    yield cls.create(_id=doc_id, **overrides)
+            else:
+                for doc_id, numbers in zip(ids, rows):
+                    yield cls.build(_id=doc_id, _numbers=numbers, **overrides)
     
     @classmethod
     def build(cls, **overrides) -> Dict[str, Any]:
         """Build document dictionary (override in subclasses)"""
         raise NotImplementedError()
+    
+    @classmethod
+    def _assemble(cls, overrides: Dict[str, Any], numbers: Optional[Dict[str, Any]] = None,
+                  now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Build a document from _DEFAULT_BUILDERS, taking overridden fields as given
+        
+        Default builders only run for fields missing from overrides, so
+        overriding a field skips generating its value entirely.
+        """
+        context = _BuildContext(cls, numbers, now or datetime.now())
+        doc = context.doc
+        for key, default in cls._DEFAULT_BUILDERS.items():
+            doc[key] = overrides[key] if key in overrides else default(context)
+        return doc
+    
+    @classmethod
+    def numeric_rows(cls, count: int) -> Optional[Iterator[Dict[str, Any]]]:
+        """Numeric fields for count documents drawn as NumPy columns (None = per document)"""
+        return None
 
 
 class MovieFactory(BaseFactory):
@@ -41,72 +343,128 @@ class MovieFactory(BaseFactory):
     
     collection_name = "movies"
     
-    GENRES = ["Action", "Adventure", "Comedy", "Crime", "Drama", "Fantasy",
-              "Horror", "Thriller", "Romance", "Sci-Fi", "Animation", "Documentary"]
+    GENRES = ("Action", "Adventure", "Comedy", "Crime", "Drama", "Fantasy",
+              "Horror", "Thriller", "Romance", "Sci-Fi", "Animation", "Documentary")
     
-    RATINGS = ["G", "PG", "PG-13", "R", "NC-17", "Not Rated"]
+    RATINGS = ("G", "PG", "PG-13", "R", "NC-17", "Not Rated")
+    
+    LANGUAGES = ("English", "Spanish", "French", "German")
+    
+    COUNTRIES = ("USA", "UK", "France", "Germany", "Japan")
+    
+    # Numeric field -> draw(cls) for one movie; see _random_numbers
+    _NUMBER_DRAWS: Dict[str, Callable[[type], Any]] = {
+        "year": lambda cls: random.randint(1900, 2024),
+        "rated": lambda cls: random.choice(cls.RATINGS),
+        "language": lambda cls: random.choice(cls.LANGUAGES),
+        "country": lambda cls: random.choice(cls.COUNTRIES),
+        "runtime": lambda cls: random.randint(80, 240),
+        "genre_count": lambda cls: random.randint(1, 3),
+        "writer_count": lambda cls: random.randint(1, 3),
+        "cast_count": lambda cls: random.randint(1, 8),
+        "released_year": lambda cls: random.randint(1900, 2024),
+        "released_month": lambda cls: random.randint(1, 12),
+        "released_day": lambda cls: random.randint(1, 28),
+        "imdb_rating": lambda cls: round(random.uniform(1, 10), 1),
+        "imdb_votes": lambda cls: random.randint(1000, 2000000),
+        "imdb_id": lambda cls: random.randint(100000, 10000000),
+        "viewer_rating": lambda cls: round(random.uniform(1, 10), 1),
+        "viewer_reviews": lambda cls: random.randint(100, 10000),
+        "wins": lambda cls: random.randint(0, 20),
+        "nominations": lambda cls: random.randint(0, 50),
+        "metacritic": lambda cls: random.randint(0, 100)
+    }
     
     @classmethod
-    def build(cls, **overrides) -> Dict[str, Any]:
-        """Build a movie document"""
+    def _random_numbers(cls, draws: Optional[Dict[str, Callable[[type], Any]]] = None) -> Dict[str, Any]:
+        """Draw the numeric fields for one movie from _NUMBER_DRAWS (or draws)"""
+        return {name: draw(cls) for name, draw in (draws or cls._NUMBER_DRAWS).items()}
+    
+    @classmethod
+    def numeric_rows(cls, count: int) -> Iterator[Dict[str, Any]]:
+        """Draw the numeric fields for count movies as NumPy columns"""
+        rng = _numpy_rng()
         
-        movie = {
-            "_id": overrides.get("_id", ObjectId()),
-            "title": overrides.get("title", fake.sentence(nb_words=3).rstrip('.')),
-            "year": overrides.get("year", fake.random_int(min=1900, max=2024)),
-            "rated": overrides.get("rated", fake.random_element(cls.RATINGS)),
-            "runtime": overrides.get("runtime", fake.random_int(min=80, max=240)),
-            "genres": overrides.get("genres", fake.random_sample(
-                elements=cls.GENRES, 
-                length=fake.random_int(min=1, max=3)
-            )),
-            "director": overrides.get("director", fake.name()),
-            "writers": overrides.get("writers", [fake.name() for _ in range(
-                fake.random_int(min=1, max=3)
-            )]),
-            "cast": overrides.get("cast", [fake.name() for _ in range(
-                fake.random_int(min=1, max=8)
-            )]),
-            "plot": overrides.get("plot", fake.text(max_nb_chars=200)),
-            "fullplot": overrides.get("fullplot", fake.text(max_nb_chars=500)),
-            "languages": overrides.get("languages", 
-                                      fake.random_sample(
-                                          elements=["English", "Spanish", "French", "German"],
-                                          length=1
-                                      )),
-            "countries": overrides.get("countries", 
-                                      fake.random_sample(
-                                          elements=["USA", "UK", "France", "Germany", "Japan"],
-                                          length=1
-                                      )),
-            "type": overrides.get("type", "movie"),
-            "released": overrides.get("released", 
-                                     datetime(
-                                         year=fake.random_int(min=1900, max=2024),
-                                         month=fake.random_int(min=1, max=12),
-                                         day=fake.random_int(min=1, max=28)
-                                     )),
-            "imdb": overrides.get("imdb", {
-                "rating": round(fake.pyfloat(min_value=1, max_value=10), 1),
-                "votes": fake.random_int(min=1000, max=2000000),
-                "id": fake.random_int(min=100000, max=10000000)
-            }),
-            "tomatoes": overrides.get("tomatoes", {
-                "viewer": {
-                    "rating": round(fake.pyfloat(min_value=1, max_value=10), 1),
-                    "numReviews": fake.random_int(min=100, max=10000)
-                },
-                "lastUpdated": datetime.now()
-            }),
-            "awards": overrides.get("awards", {
-                "wins": fake.random_int(min=0, max=20),
-                "nominations": fake.random_int(min=0, max=50)
-            }),
-            "poster": overrides.get("poster", fake.url()),
-            "metacritic": overrides.get("metacritic", fake.random_int(min=0, max=100))
+        # Upper bounds are exclusive in Generator.integers
+        columns = {
+            "year": rng.integers(1900, 2025, count),
+            "rated": rng.integers(0, len(cls.RATINGS), count),
+            "language": rng.integers(0, len(cls.LANGUAGES), count),
+            "country": rng.integers(0, len(cls.COUNTRIES), count),
+            "runtime": rng.integers(80, 241, count),
+            "genre_count": rng.integers(1, 4, count),
+            "writer_count": rng.integers(1, 4, count),
+            "cast_count": rng.integers(1, 9, count),
+            "released_year": rng.integers(1900, 2025, count),
+            "released_month": rng.integers(1, 13, count),
+            "released_day": rng.integers(1, 29, count),
+            "imdb_rating": rng.uniform(1, 10, count).round(1),
+            "imdb_votes": rng.integers(1000, 2000001, count),
+            "imdb_id": rng.integers(100000, 10000001, count),
+            "viewer_rating": rng.uniform(1, 10, count).round(1),
+            "viewer_reviews": rng.integers(100, 10001, count),
+            "wins": rng.integers(0, 21, count),
+            "nominations": rng.integers(0, 51, count),
+            "metacritic": rng.integers(0, 101, count)
         }
         
-        return movie
+        # tolist() yields plain Python ints/floats, which BSON can encode;
+        # choice columns are drawn as indices and mapped back to their values
+        lists = {name: values.tolist() for name, values in columns.items()}
+        for name, choices in (("rated", cls.RATINGS), ("language", cls.LANGUAGES),
+                              ("country", cls.COUNTRIES)):
+            lists[name] = [choices[i] for i in lists[name]]
+        
+        names = list(lists)
+        for values in zip(*(lists[name] for name in names)):
+            yield dict(zip(names, values))
+    
+    # Field -> default builder, in document order; see BaseFactory._assemble
+    _DEFAULT_BUILDERS = {
+        "_id": lambda c: ObjectId(),
+        "title": lambda c: c.providers.title(3),
+        "year": lambda c: c.numbers["year"],
+        "rated": lambda c: c.numbers["rated"],
+        "runtime": lambda c: c.numbers["runtime"],
+        "genres": lambda c: random.sample(c.cls.GENRES, c.numbers["genre_count"]),
+        "director": lambda c: _pooled("name"),
+        "writers": lambda c: [_pooled("name") for _ in range(c.numbers["writer_count"])],
+        "cast": lambda c: [_pooled("name") for _ in range(c.numbers["cast_count"])],
+        "plot": lambda c: _pooled("text200"),
+        "fullplot": lambda c: _pooled("text500"),
+        "languages": lambda c: [c.numbers["language"]],
+        "countries": lambda c: [c.numbers["country"]],
+        "type": lambda c: "movie",
+        "released": lambda c: datetime(
+            year=c.numbers["released_year"],
+            month=c.numbers["released_month"],
+            day=c.numbers["released_day"]
+        ),
+        "imdb": lambda c: {
+            "rating": c.numbers["imdb_rating"],
+            "votes": c.numbers["imdb_votes"],
+            "id": c.numbers["imdb_id"]
+        },
+        "tomatoes": lambda c: {
+            "viewer": {
+                "rating": c.numbers["viewer_rating"],
+                "numReviews": c.numbers["viewer_reviews"]
+            },
+            "lastUpdated": c.now
+        },
+        "awards": lambda c: {
+            "wins": c.numbers["wins"],
+            "nominations": c.numbers["nominations"]
+        },
+        "poster": lambda c: _pooled("url"),
+        "metacritic": lambda c: c.numbers["metacritic"]
+    }
+    
+    @classmethod
+    def build(cls, _numbers: Optional[Dict[str, Any]] = None, _now: Optional[datetime] = None,
+              **overrides) -> Dict[str, Any]:
+        """Build a movie document"""
+        return cls._assemble(overrides, _numbers or cls._random_numbers(), _now)
 
 
 class UserFactory(BaseFactory):
@@ -114,52 +472,52 @@ class UserFactory(BaseFactory):
     
     collection_name = "users"
     
+    PREFERRED_GENRES = ("Action", "Drama", "Thriller", "Comedy", "Horror")
+    
+    _DEFAULT_BUILDERS = {
+        "_id": lambda c: ObjectId(),
+        "username": lambda c: c.providers.username(),
+        "email": lambda c: c.providers.email(),
+        "password_hash": lambda c: _pooled("sha256"),
+        "profile": lambda c: {
+            "name": _pooled("name"),
+            "bio": _pooled("text100"),
+            "avatar_url": _pooled("url"),
+            "created_at": c.now - _DAY_DELTAS[random.randint(1, 365)]
+        },
+        # Movie ids to reference
+        "favorite_movies": lambda c: [ObjectId() for _ in range(random.randint(0, 10))],
+        "watch_history": lambda c: [
+            {
+                "movie_id": ObjectId(),
+                "watched_at": c.now - _DAY_DELTAS[random.randint(0, 30)],
+                "rating": random.randint(1, 10),
+                "is_completed": random.random() < 0.5
+            }
+            for _ in range(random.randint(0, 5))
+        ],
+        "preferences": lambda c: {
+            "genres": random.sample(c.cls.PREFERRED_GENRES, random.randint(1, 3)),
+            "language": random.choice(["en", "es", "fr", "de"]),
+            "notifications_enabled": random.random() < 0.5,
+            "theme": random.choice(["light", "dark"])
+        },
+        "subscription": lambda c: {
+            "plan": random.choice(["free", "basic", "premium"]),
+            "active": random.random() < 0.5,
+            "expires_at": c.now + _DAY_DELTAS[random.randint(0, 365)]
+        },
+        "created_at": lambda c: c.now - _DAY_DELTAS[random.randint(1, 365)],
+        "updated_at": lambda c: c.now
+    }
+    
     @classmethod
-    def build(cls, **overrides) -> Dict[str, Any]:
-        """Build a user document"""
-        
-        # Pre-generate a movie list to reference
-        movie_ids = [ObjectId() for _ in range(random.randint(0, 10))]
-        
-        user = {
-            "_id": overrides.get("_id", ObjectId()),
-            "username": overrides.get("username", fake.user_name()),
-            "email": overrides.get("email", fake.email()),
-            "password_hash": overrides.get("password_hash", fake.sha256()),
-            "profile": overrides.get("profile", {
-                "name": fake.name(),
-                "bio": fake.text(max_nb_chars=100),
-                "avatar_url": fake.url(),
-                "created_at": datetime.now() - timedelta(days=fake.random_int(min=1, max=365))
-            }),
-            "favorite_movies": overrides.get("favorite_movies", movie_ids),
-            "watch_history": overrides.get("watch_history", [
-                {
-                    "movie_id": ObjectId(),
-                    "watched_at": datetime.now() - timedelta(days=fake.random_int(min=0, max=30)),
-                    "rating": fake.random_int(min=1, max=10),
-                    "is_completed": fake.pybool()
-                }
-                for _ in range(random.randint(0, 5))
-            ]),
-            "preferences": overrides.get("preferences", {
-                "genres": fake.random_sample(
-                    elements=["Action", "Drama", "Thriller", "Comedy", "Horror"],
-                    length=random.randint(1, 3)
-                ),
-                "language": fake.random_element(["en", "es", "fr", "de"]),
-                "notifications_enabled": fake.pybool(),
-                "theme": fake.random_element(["light", "dark"])
-            }),
-            "subscription": overrides.get("subscription", {
-                "plan": fake.random_element(["free", "basic", "premium"]),
-                "active": fake.pybool(),
-                "expires_at": datetime.now() + timedelta(days=fake.random_int(min=0, max=365))
-            }),
-            "created_at": overrides.get("created_at", 
-                                       datetime.now() - timedelta(days=fake.random_int(min=1, max=365))),
-            "updated_at": overrides.get("updated_at", datetime.now())
-        }
+    def build(cls, mask_pii: bool = False, _now: Optional[datetime] = None,
+              **overrides) -> Dict[str, Any]:
+        """Build a user document, masking the email when mask_pii is set"""
+        user = cls._assemble(overrides, now=_now)
+        if mask_pii:
+            user["email"] = mask_email(user["email"])
         
         return user
 
@@ -169,34 +527,33 @@ class CommentFactory(BaseFactory):
     
     collection_name = "comments"
     
+    _DEFAULT_BUILDERS = {
+        "_id": lambda c: ObjectId(),
+        "movie_id": lambda c: ObjectId(),
+        "user_id": lambda c: ObjectId(),
+        "email": lambda c: _pooled("email"),
+        "text": lambda c: _pooled("text500"),
+        "date": lambda c: c.now - _DAY_DELTAS[random.randint(0, 365)],
+        "likes": lambda c: random.randint(0, 1000),
+        "is_hidden": lambda c: random.random() < 0.05,
+        "rating": lambda c: random.randint(1, 10),
+        "replies": lambda c: [
+            {
+                "_id": ObjectId(),
+                "user_id": ObjectId(),
+                "email": _pooled("email"),
+                "text": _pooled("text200"),
+                "date": c.now - _DAY_DELTAS[random.randint(0, 30)],
+                "likes": random.randint(0, 100)
+            }
+            for _ in range(random.randint(0, 3))
+        ]
+    }
+    
     @classmethod
-    def build(cls, **overrides) -> Dict[str, Any]:
+    def build(cls, _now: Optional[datetime] = None, **overrides) -> Dict[str, Any]:
         """Build a comment document"""
-        
-        comment = {
-            "_id": overrides.get("_id", ObjectId()),
-            "movie_id": overrides.get("movie_id", ObjectId()),
-            "user_id": overrides.get("user_id", ObjectId()),
-            "email": overrides.get("email", fake.email()),
-            "text": overrides.get("text", fake.text(max_nb_chars=500)),
-            "date": overrides.get("date", datetime.now() - timedelta(days=fake.random_int(min=0, max=365))),
-            "likes": overrides.get("likes", fake.random_int(min=0, max=1000)),
-            "is_hidden": overrides.get("is_hidden", fake.pybool(truth_percentage=5)),
-            "rating": overrides.get("rating", fake.random_int(min=1, max=10)),
-            "replies": overrides.get("replies", [
-                {
-                    "_id": ObjectId(),
-                    "user_id": ObjectId(),
-                    "email": fake.email(),
-                    "text": fake.text(max_nb_chars=200),
-                    "date": datetime.now() - timedelta(days=fake.random_int(min=0, max=30)),
-                    "likes": fake.random_int(min=0, max=100)
-                }
-                for _ in range(random.randint(0, 3))
-            ])
-        }
-        
-        return comment
+        return cls._assemble(overrides, now=_now)
 
 
 class SessionFactory(BaseFactory):
@@ -204,33 +561,29 @@ class SessionFactory(BaseFactory):
     
     collection_name = "sessions"
     
+    # expires_at and last_activity follow whichever created_at the document got
+    _DEFAULT_BUILDERS = {
+        "_id": lambda c: ObjectId(),
+        "user_id": lambda c: ObjectId(),
+        "token": lambda c: c.providers.sha256(),
+        "refresh_token": lambda c: c.providers.sha256(),
+        "created_at": lambda c: c.now - _HOUR_DELTAS[random.randint(0, 24)],
+        "expires_at": lambda c: c.doc["created_at"] + _HOUR_DELTAS[24],
+        "last_activity": lambda c: c.doc["created_at"] + _HOUR_DELTAS[random.randint(0, 24)],
+        "ip_address": lambda c: c.providers.ipv4(),
+        "user_agent": lambda c: _pooled("user_agent"),
+        "device_info": lambda c: {
+            "type": random.choice(["web", "mobile", "tablet"]),
+            "os": random.choice(["Windows", "macOS", "Linux", "iOS", "Android"]),
+            "browser": random.choice(["Chrome", "Firefox", "Safari", "Edge"])
+        },
+        "is_active": lambda c: random.random() < 0.8
+    }
+    
     @classmethod
-    def build(cls, **overrides) -> Dict[str, Any]:
+    def build(cls, _now: Optional[datetime] = None, **overrides) -> Dict[str, Any]:
         """Build a session document"""
-        
-        created_at = datetime.now() - timedelta(hours=fake.random_int(min=0, max=24))
-        expires_at = created_at + timedelta(hours=24)
-        
-        session = {
-            "_id": overrides.get("_id", ObjectId()),
-            "user_id": overrides.get("user_id", ObjectId()),
-            "token": overrides.get("token", fake.sha256()),
-            "refresh_token": overrides.get("refresh_token", fake.sha256()),
-            "created_at": overrides.get("created_at", created_at),
-            "expires_at": overrides.get("expires_at", expires_at),
-            "last_activity": overrides.get("last_activity", 
-                                          created_at + timedelta(hours=fake.random_int(min=0, max=24))),
-            "ip_address": overrides.get("ip_address", fake.ipv4()),
-            "user_agent": overrides.get("user_agent", fake.user_agent()),
-            "device_info": overrides.get("device_info", {
-                "type": fake.random_element(["web", "mobile", "tablet"]),
-                "os": fake.random_element(["Windows", "macOS", "Linux", "iOS", "Android"]),
-                "browser": fake.random_element(["Chrome", "Firefox", "Safari", "Edge"])
-            }),
-            "is_active": overrides.get("is_active", fake.pybool(truth_percentage=80))
-        }
-        
-        return session
+        return cls._assemble(overrides, now=_now)
 
 
 # Example usage functions
@@ -244,77 +597,144 @@ def create_user_dataset(count: int = 50) -> List[Dict[str, Any]]:
     return UserFactory.create_batch(count)
 
 
-def create_comment_dataset(count: int = 200, movie_ids: Optional[List[ObjectId]] = None,
-                          user_ids: Optional[List[ObjectId]] = None) -> List[Dict[str, Any]]:
-    """Create test dataset of comments with references"""
-    comments = []
+def _threaded_iter(build_one, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield count documents from build_one, built on threads DATASET_CHUNK_SIZE at a time"""
+    with ThreadPoolExecutor(max_workers=DATASET_THREADS) as executor:
+        for start in range(0, count, DATASET_CHUNK_SIZE):
+            yield from executor.map(build_one, range(min(DATASET_CHUNK_SIZE, count - start)))
+
+
+def iter_comment_dataset(count: int = 200, movie_ids: Optional[List[ObjectId]] = None,
+                         user_ids: Optional[List[ObjectId]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream a test dataset of comments with references"""
+    now = datetime.now()
     
-    for _ in range(count):
-        comment = CommentFactory.create(
+    def _build_one(_) -> Dict[str, Any]:
+        return CommentFactory.create(
             movie_id=random.choice(movie_ids) if movie_ids else ObjectId(),
-            user_id=random.choice(user_ids) if user_ids else ObjectId()
+            user_id=random.choice(user_ids) if user_ids else ObjectId(),
+            _now=now
         )
-        comments.append(comment)
     
-    return comments
+    return _threaded_iter(_build_one, count)
+
+
+def iter_session_dataset(count: int = 100, user_ids: Optional[List[ObjectId]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream a test dataset of sessions"""
+    now = datetime.now()
+    
+    def _build_one(_) -> Dict[str, Any]:
+        return SessionFactory.create(
+            user_id=random.choice(user_ids) if user_ids else ObjectId(),
+            _now=now
+        )
+    
+    return _threaded_iter(_build_one, count)
+
+
+def create_comment_dataset(count: int = 200, movie_ids: Optional[List[ObjectId]] = None,
+                          user_ids: Optional[List[ObjectId]] = None) -> List[Dict[str, Any]]:
+    """Create test dataset of comments with references"""
+    return list(iter_comment_dataset(count, movie_ids, user_ids))
 
 
 def create_session_dataset(count: int = 100, user_ids: Optional[List[ObjectId]] = None) -> List[Dict[str, Any]]:
     """Create test dataset of sessions"""
-    sessions = []
+    return list(iter_session_dataset(count, user_ids))
+
+
+def insert_stream(collection: Collection, docs: Iterable[Dict[str, Any]]) -> int:
+    """
+    Insert streamed documents in DATASET_CHUNK_SIZE chunks, overlapping generation with I/O
     
-    for _ in range(count):
-        session = SessionFactory.create(
-            user_id=random.choice(user_ids) if user_ids else ObjectId()
-        )
-        sessions.append(session)
+    Each chunk is written with an unordered insert_many on a background
+    thread while the next chunk is generated; at most one chunk is in
+    flight, so peak memory stays around two chunks.
+    
+    Returns:
+        Number of documents inserted
+    """
+    docs = iter(docs)
+    inserted = 0
+    pending = None
     
-    return sessions
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            chunk = list(itertools.islice(docs, DATASET_CHUNK_SIZE))
+            if pending is not None:
+                inserted += len(pending.result().inserted_ids)
+                pending = None
+            if not chunk:
+                break
+            pending = executor.submit(collection.insert_many, chunk,
+                                      ordered=False, bypass_document_validation=True)
+    
+    return inserted
+
+
+def create_comment_dataset_and_insert(collection: Collection, count: int = 200,
+                                      movie_ids: Optional[List[ObjectId]] = None,
+                                      user_ids: Optional[List[ObjectId]] = None) -> int:
+    """Generate comments straight into collection; returns the number inserted"""
+    return insert_stream(collection, iter_comment_dataset(count, movie_ids, user_ids))
+
+
+def create_session_dataset_and_insert(collection: Collection, count: int = 100,
+                                      user_ids: Optional[List[ObjectId]] = None) -> int:
+    """Generate sessions straight into collection; returns the number inserted"""
+    return insert_stream(collection, iter_session_dataset(count, user_ids))
 
 
 # Advanced factory methods for specific test scenarios
 
+def _compile_variant(factory, doc: str,
+                     number_draws: Dict[str, Callable[[type], Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Specialise a factory for a variant by swapping in its own numeric draws
+    
+    The variant's draws are merged into the factory's _NUMBER_DRAWS once, at
+    import, so each call draws the variant values directly instead of
+    drawing the default values and then overriding them.
+    """
+    draws = {
+        key: number_draws.get(key, default)
+        for key, default in factory._NUMBER_DRAWS.items()
+    }
+    
+    def create(**overrides) -> Dict[str, Any]:
+        if "_numbers" not in overrides:
+            overrides["_numbers"] = factory._random_numbers(draws)
+        return factory.build(**overrides)
+    
+    create.__doc__ = doc
+    return create
+
+
 class MovieFactoryVariants:
     """Variants of movie factory for specific test scenarios"""
     
-    @staticmethod
-    def create_classic_movie(**overrides) -> Dict[str, Any]:
-        """Create a classic movie (pre-1980)"""
-        return MovieFactory.create(
-            year=fake.random_int(min=1900, max=1979),
-            **overrides
-        )
+    create_classic_movie = staticmethod(_compile_variant(
+        MovieFactory, "Create a classic movie (pre-1980)",
+        number_draws={"year": lambda cls: random.randint(1900, 1979)}
+    ))
     
-    @staticmethod
-    def create_modern_movie(**overrides) -> Dict[str, Any]:
-        """Create a modern movie (2000-2024)"""
-        return MovieFactory.create(
-            year=fake.random_int(min=2000, max=2024),
-            **overrides
-        )
+    create_modern_movie = staticmethod(_compile_variant(
+        MovieFactory, "Create a modern movie (2000-2024)",
+        number_draws={"year": lambda cls: random.randint(2000, 2024)}
+    ))
     
-    @staticmethod
-    def create_high_rated_movie(**overrides) -> Dict[str, Any]:
-        """Create a highly rated movie (IMDB > 8.0)"""
-        return MovieFactory.create(
-            imdb={
-                "rating": round(fake.pyfloat(min_value=8.0, max_value=10.0), 1),
-                "votes": fake.random_int(min=50000, max=2000000),
-                "id": fake.random_int(min=100000, max=10000000)
-            },
-            **overrides
-        )
+    create_high_rated_movie = staticmethod(_compile_variant(
+        MovieFactory, "Create a highly rated movie (IMDB > 8.0)",
+        number_draws={
+            "imdb_rating": lambda cls: round(random.uniform(8.0, 10.0), 1),
+            "imdb_votes": lambda cls: random.randint(50000, 2000000)
+        }
+    ))
     
     @staticmethod
     def create_movie_batch_with_genres(count: int, genres: List[str], **overrides) -> List[Dict[str, Any]]:
         """Create movies with specific genres"""
-        movies = []
-        for _ in range(count):
-            movies.append(MovieFactory.create(
-                genres=genres,
-                **overrides
-            ))
-        return movies
+        return MovieFactory.create_batch(count, genres=genres, **overrides)
 
 
 class UserFactoryVariants:
@@ -327,7 +747,7 @@ class UserFactoryVariants:
             subscription={
                 "plan": "premium",
                 "active": True,
-                "expires_at": datetime.now() + timedelta(days=365)
+                "expires_at": datetime.now() + _DAY_DELTAS[365]
             },
             **overrides
         )
@@ -337,10 +757,10 @@ class UserFactoryVariants:
         """Create a newly registered user (created in last 7 days)"""
         return UserFactory.create(
             profile={
-                "name": fake.name(),
-                "bio": fake.text(max_nb_chars=100),
-                "avatar_url": fake.url(),
-                "created_at": datetime.now() - timedelta(days=fake.random_int(min=0, max=7))
+                "name": _pooled("name"),
+                "bio": _pooled("text100"),
+                "avatar_url": _pooled("url"),
+                "created_at": datetime.now() - _DAY_DELTAS[random.randint(0, 7)]
             },
             **overrides
         )
@@ -352,8 +772,8 @@ class UserFactoryVariants:
             watch_history=[
                 {
                     "movie_id": ObjectId(),
-                    "watched_at": datetime.now() - timedelta(days=fake.random_int(min=0, max=30)),
-                    "rating": fake.random_int(min=1, max=10),
+                    "watched_at": datetime.now() - _DAY_DELTAS[random.randint(0, 30)],
+                    "rating": random.randint(1, 10),
                     "is_completed": True
                 }
                 for _ in range(min_watches)
@@ -385,5 +805,4 @@ if __name__ == "__main__":
     print(f"Created {len(sessions)} sessions")
     
     print("\nExample movie:")
-    import json
-    print(json.dumps(movies[0], indent=2, default=str))
+    print(dumps(movies[0]))
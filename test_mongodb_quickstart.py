@@ -4,10 +4,28 @@ Quick Start Test - MongoDB ISTA Framework
 Demonstrates test data provisioning and usage
 """
 
+import atexit
 import os
 from pymongo import MongoClient
 import json
 
+# Connection pool size for the shared quick start client
+MAX_POOL_SIZE = 10
+
+# One client shared by every test, so the topology discovery, TLS
+# handshake and auth happen once per run rather than once per test
+_client = None
+
+
+def get_client(mongodb_uri: str) -> MongoClient:
+    """Return the shared MongoClient, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = MongoClient(mongodb_uri, maxPoolSize=MAX_POOL_SIZE)
+        atexit.register(_client.close)
+    return _client
+
+
 def test_mongodb_connection():
     """Test 1: Verify MongoDB connection"""
     print("\n" + "="*60)
@@ -21,7 +39,7 @@ def test_mongodb_connection():
         print("  Or add to .env file")
         return False
     
-    client = MongoClient(mongodb_uri)
+    client = get_client(mongodb_uri)
     
     try:
         # Verify connection
@@ -38,8 +56,6 @@ def test_mongodb_connection():
     except Exception as e:
         print(f"✗ Connection failed: {e}")
         return False
-    finally:
-        client.close()
 
 
 def test_movies_collection():
@@ -53,14 +69,14 @@ def test_movies_collection():
         print("✗ MONGODB_URI environment variable not set")
         return False
     
-    client = MongoClient(mongodb_uri)
+    client = get_client(mongodb_uri)
     
     try:
         db = client.sample_mflix
         movies = db.movies
         
-        # Count documents
-        count = movies.count_documents({})
+        # Count documents (from collection metadata, no scan)
+        count = movies.estimated_document_count()
         print(f"✓ Total movies in collection: {count}")
         
         # Find high-rated movies
@@ -68,7 +84,8 @@ def test_movies_collection():
         print(f"✓ High-rated movies (IMDB >= 8.0): {high_rated}")
         
         # Get sample movie
-        sample = movies.find_one({"imdb.rating": {"$gte": 8.0}})
+        sample = movies.find_one({"imdb.rating": {"$gte": 8.0}},
+                                 projection={"title": 1, "year": 1, "imdb": 1})
         if sample:
             print(f"✓ Sample high-rated movie: '{sample['title']}' ({sample['year']})")
             print(f"  Rating: {sample['imdb']['rating']}/10, Votes: {sample['imdb']['votes']}")
@@ -77,8 +94,6 @@ def test_movies_collection():
     except Exception as e:
         print(f"✗ Query failed: {e}")
         return False
-    finally:
-        client.close()
 
 
 def test_users_collection():
@@ -92,14 +107,14 @@ def test_users_collection():
         print("✗ MONGODB_URI environment variable not set")
         return False
     
-    client = MongoClient(mongodb_uri)
+    client = get_client(mongodb_uri)
     
     try:
         db = client.sample_mflix
         users = db.users
         
-        # Count documents
-        count = users.count_documents({})
+        # Count documents (from collection metadata, no scan)
+        count = users.estimated_document_count()
         print(f"✓ Total users in collection: {count}")
         
         # Get sample user
@@ -113,8 +128,6 @@ def test_users_collection():
     except Exception as e:
         print(f"✗ Query failed: {e}")
         return False
-    finally:
-        client.close()
 
 
 def test_data_factory():
@@ -182,7 +195,8 @@ def test_data_adapter():
         print(f"✓ Collection stats - Documents: {count}, Size: {size_mb:.2f} MB")
         
         # Query documents
-        docs = adapter.find_documents('movies', {'year': {'$gte': 2020}}, limit=3)
+        docs = adapter.find_documents('movies', {'year': {'$gte': 2020}}, limit=3,
+                                      projection={'_id': 1})
         print(f"✓ Found {len(docs)} movies from 2020 onwards")
         
         # Disconnect
@@ -0,0 +1,10 @@
+"""Make the repo root and test-data-automation importable from the tests"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+for path in (ROOT, ROOT / 'test-data-automation'):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
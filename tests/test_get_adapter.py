@@ -0,0 +1,34 @@
+"""get_adapter shared-instance cache"""
+
+import pytest
+
+mongomock = pytest.importorskip('mongomock')
+
+from governance import data_adapter
+from governance.data_adapter import get_adapter
+
+URI = 'mongodb://localhost/testdb'
+
+
+@pytest.fixture(autouse=True)
+def mock_client(monkeypatch):
+    monkeypatch.setattr('pymongo.MongoClient', mongomock.MongoClient)
+    monkeypatch.setattr(data_adapter, '_CLIENT_CACHE', {})
+    monkeypatch.setattr(data_adapter, '_SHARED_ADAPTERS', {})
+
+
+def test_same_database_returns_the_shared_adapter():
+    assert get_adapter('mongodb', URI) is get_adapter('MongoDB', URI)
+
+
+def test_disconnect_evicts_the_shared_adapter():
+    first = get_adapter('mongodb', URI)
+    first.disconnect()
+
+    second = get_adapter('mongodb', URI)
+    assert second is not first
+    assert second.db is not None
+
+
+def test_without_connection_string_returns_a_private_adapter():
+    assert get_adapter('mongodb') is not get_adapter('mongodb')
@@ -0,0 +1,50 @@
+"""ista-data status --watch and the NDJSON provision stream, against a fake API"""
+
+import json
+import types
+
+import click
+import pytest
+
+pytest.importorskip('requests')
+from click.testing import CliRunner
+
+import ista_data_cli
+from ista_data_cli import _read_provision_stream, cli
+
+
+def _response(body):
+    return types.SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+
+
+def test_watch_stops_after_the_timeout_on_a_status_that_never_finishes(monkeypatch):
+    polls = []
+    clock = iter(range(0, 1000, 2))
+
+    def get(url):
+        polls.append(url)
+        return _response({'status': 'queued-for-review'})
+
+    monkeypatch.setattr(ista_data_cli._SESSION, 'get', get)
+    monkeypatch.setattr(ista_data_cli.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(ista_data_cli.time, 'monotonic', lambda: next(clock))
+
+    result = CliRunner().invoke(cli, ['status', 'abc', '--watch', '--interval', '2', '--timeout', '10'])
+
+    assert result.exit_code == 1
+    assert "stopped watching" in result.output
+    assert len(polls) == 5
+
+
+def test_provision_stream_reports_a_malformed_event_as_a_click_error():
+    response = types.SimpleNamespace(iter_lines=lambda: [b'{"dataset": "users", "count": 3}', b'{"dataset": "movies"}'])
+
+    with pytest.raises(click.ClickException, match="without dataset/count"):
+        _read_provision_stream(response)
+
+
+def test_provision_stream_rejects_a_line_that_is_not_json():
+    response = types.SimpleNamespace(iter_lines=lambda: [b'not json'])
+
+    with pytest.raises(click.ClickException, match="Malformed provision event"):
+        _read_provision_stream(response)
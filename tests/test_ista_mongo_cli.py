@@ -0,0 +1,144 @@
+"""ista provision/cleanup/show against mongomock"""
+
+import pytest
+
+mongomock = pytest.importorskip('mongomock')
+from click.testing import CliRunner
+
+import ista_mongo_cli
+import mongo_factories
+from ista_mongo_cli import cli
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(ista_mongo_cli, 'MongoClient', lambda *args, **kwargs: client)
+    monkeypatch.setattr(ista_mongo_cli, '_CLIENTS', {})
+
+    # mongomock has no $collStats stage and rejects bypass_document_validation
+    def coll_stats(self, pipeline, *args, **kwargs):
+        count = self.count_documents({})
+        return [{'storageStats': {'count': count, 'size': 100 * count, 'nindexes': 1}}]
+
+    bulk_write = mongomock.collection.Collection.bulk_write
+
+    def bulk_write_without_bypass(self, requests, bypass_document_validation=False, **kwargs):
+        return bulk_write(self, requests, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, 'aggregate', coll_stats)
+    monkeypatch.setattr(mongomock.collection.Collection, 'bulk_write', bulk_write_without_bypass)
+    return client.testdb
+
+
+def _run(*args, input=None):
+    return CliRunner().invoke(cli, ['--mongodb-uri', 'mongodb://localhost/testdb', *args],
+                              obj={}, input=input)
+
+
+def test_provision_generates_in_worker_processes_when_asked(mongo):
+    result = _run('provision', '-d', 'users', '--volumes', '{"users": 4}',
+                  '--batch-size', '2', '--processes', '2')
+
+    assert result.exit_code == 0, result.output
+    assert mongo.users.count_documents({}) == 4
+    assert len(mongo.users.distinct('_id')) == 4
+    # The pool is sized from --processes, not the CPU count
+    assert 2 in mongo_factories._PROCESS_POOLS
+
+
+def test_provision_hands_each_worker_a_whole_batch(mongo, monkeypatch):
+    requested = []
+
+    def create_batch_parallel(cls, count, workers=None, **overrides):
+        requested.append(count)
+        return cls.create_batch(count, **overrides)
+
+    monkeypatch.setattr(mongo_factories.UserFactory, 'create_batch_parallel',
+                        classmethod(create_batch_parallel))
+
+    result = _run('provision', '-d', 'users', '--volumes', '{"users": 10}',
+                  '--batch-size', '2', '--processes', '2')
+
+    assert result.exit_code == 0, result.output
+    assert requested == [4, 4, 2]
+    assert mongo.users.count_documents({}) == 10
+
+
+def test_provision_runs_a_repeated_collection_once(mongo):
+    mongo.users.insert_one({'name': 'stale'})
+
+    result = _run('provision', '-d', 'users', '-d', 'users', '--volumes', '{"users": 3}', '--clear')
+
+    assert result.exit_code == 0, result.output
+    assert mongo.users.count_documents({}) == 3
+    assert mongo.users.count_documents({'name': 'stale'}) == 0
+    assert 'Total provisioned: 3 documents' in result.output
+
+
+def test_provision_after_cleanup_rebuilds_the_spec_indexes(mongo):
+    mongo.users.insert_one({'name': 'stale'})
+
+    assert _run('cleanup', '--force').exit_code == 0
+    result = _run('provision', '-d', 'users', '--volumes', '{"users": 3}')
+
+    assert result.exit_code == 0, result.output
+    indexes = mongo.users.index_information()
+    assert indexes['username_1'].get('unique')
+    assert indexes['email_1'].get('unique')
+    assert 'profile.created_at_1' in indexes
+
+
+def test_show_prints_at_most_limit_documents(mongo):
+    mongo.users.insert_many([{'name': f'user{i}'} for i in range(3)])
+
+    result = _run('show', '-c', 'users', '--limit', '2')
+
+    assert result.exit_code == 0, result.output
+    assert 'Document 2' in result.output
+    assert 'Document 3' not in result.output
+
+
+@pytest.mark.parametrize('limit', ['0', '-1'])
+def test_show_rejects_a_non_positive_limit_as_a_usage_error(mongo, limit):
+    result = _run('show', '-c', 'users', '--limit', limit)
+
+    assert result.exit_code == 2
+    assert "Invalid value for '--limit'" in result.output
+
+
+def test_run_script_runs_steps_in_order_on_one_client(mongo, monkeypatch, tmp_path):
+    clients = []
+    make_client = ista_mongo_cli.MongoClient
+
+    def counting_client(*args, **kwargs):
+        clients.append(args)
+        return make_client(*args, **kwargs)
+
+    monkeypatch.setattr(ista_mongo_cli, 'MongoClient', counting_client)
+    script = tmp_path / 'script.yaml'
+    script.write_text(
+        "steps:\n"
+        "  - provision -d users --volumes '{\"users\":3}' --clear\n"
+        "  - show -c users --limit 1\n"
+    )
+
+    result = _run('run-script', str(script))
+
+    assert result.exit_code == 0, result.output
+    assert len(clients) == 1
+    assert mongo.users.count_documents({}) == 3
+    assert result.output.index('Step 1') < result.output.index('Total provisioned: 3')
+    assert result.output.index('Total provisioned: 3') < result.output.index('Step 2')
+    assert 'Document 1' in result.output
+
+
+@pytest.mark.parametrize('step', ["''", "'   '"])
+def test_run_script_rejects_an_empty_step_as_a_usage_error(mongo, tmp_path, step):
+    script = tmp_path / 'script.yaml'
+    script.write_text(f"steps:\n  - status\n  - {step}\n")
+
+    result = _run('run-script', str(script))
+
+    assert result.exit_code == 2, result.output
+    assert 'step 2 is empty' in result.output
@@ -0,0 +1,192 @@
+"""Batch, streaming and process-parallel APIs of the MongoDB data factories"""
+
+import threading
+import time
+import types
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import mongo_factories
+from mongo_factories import MovieFactory, MovieFactoryVariants, SessionFactory, UserFactory, insert_stream, object_id_block
+
+
+def _run_one_after_another(target, times: int = 2):
+    for _ in range(times):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+        # Give the finished thread time to exit so the next one can reuse its ident
+        time.sleep(0.05)
+
+
+def test_threads_run_one_after_another_do_not_replay_values():
+    docs = []
+    _run_one_after_another(lambda: docs.extend(UserFactory.create_batch(50)))
+
+    # A replayed seed repeats the first thread's values one for one; independent
+    # Faker draws only collide occasionally
+    for field in ('email', 'username'):
+        first, second = [doc[field] for doc in docs[:50]], [doc[field] for doc in docs[50:]]
+        assert sum(a == b for a, b in zip(first, second)) <= 2
+
+
+def test_threaded_session_tokens_are_unique():
+    tokens = []
+    _run_one_after_another(lambda: tokens.extend(doc['token'] for doc in SessionFactory.create_batch(50)))
+
+    assert len(set(tokens)) == 100
+
+
+def test_object_id_block_is_monotonic_and_unique_across_blocks():
+    first, second = object_id_block(1000), object_id_block(1000)
+
+    assert first == sorted(first)
+    assert len(set(first) | set(second)) == 2000
+
+
+def test_batch_ids_are_monotonic_within_a_chunk():
+    ids = [doc['_id'] for doc in UserFactory.create_batch(50)]
+    assert ids == sorted(ids)
+
+
+def test_create_batch_builds_unique_documents():
+    docs = UserFactory.create_batch(5, mask_pii=True)
+
+    assert len(docs) == 5
+    assert len({doc['_id'] for doc in docs}) == 5
+    assert all('***@' in doc['email'] or doc['email'] == mongo_factories.MASKED_EMAIL_FALLBACK
+               for doc in docs)
+
+
+def test_create_iter_is_lazy_and_spans_chunks(monkeypatch):
+    monkeypatch.setattr(mongo_factories, 'DATASET_CHUNK_SIZE', 3)
+
+    docs = MovieFactory.create_iter(7, type='series')
+    assert isinstance(docs, types.GeneratorType)
+
+    docs = list(docs)
+    assert len(docs) == 7
+    assert len({doc['_id'] for doc in docs}) == 7
+    assert {doc['type'] for doc in docs} == {'series'}
+
+
+def test_create_iter_keeps_a_fixed_id_override():
+    assert [doc['_id'] for doc in UserFactory.create_iter(2, _id='fixed')] == ['fixed', 'fixed']
+
+
+class _RecordingCollection:
+    def __init__(self):
+        self.chunks = []
+
+    def insert_many(self, docs, **kwargs):
+        self.chunks.append(len(docs))
+        return types.SimpleNamespace(inserted_ids=[doc['n'] for doc in docs])
+
+
+def test_insert_stream_accepts_a_list(monkeypatch):
+    monkeypatch.setattr(mongo_factories, 'DATASET_CHUNK_SIZE', 2)
+    collection = _RecordingCollection()
+
+    assert insert_stream(collection, [{'n': i} for i in range(5)]) == 5
+    assert collection.chunks == [2, 2, 1]
+
+
+def test_high_rated_variant_skips_the_default_imdb_draws(monkeypatch):
+    drawn = []
+    randint = mongo_factories.random.randint
+
+    def recording_randint(a, b):
+        drawn.append((a, b))
+        return randint(a, b)
+
+    monkeypatch.setattr(mongo_factories.random, 'randint', recording_randint)
+
+    movie = MovieFactoryVariants.create_high_rated_movie()
+    assert movie['imdb']['rating'] >= 8.0
+    assert (50000, 2000000) in drawn
+    assert (1000, 2000000) not in drawn
+
+
+def test_year_variants_keep_overrides():
+    assert all(MovieFactoryVariants.create_classic_movie()['year'] < 1980 for _ in range(20))
+    assert MovieFactoryVariants.create_modern_movie(title='Fixed')['title'] == 'Fixed'
+
+
+# Inclusive bounds of MovieFactory._NUMBER_DRAWS's numeric fields
+_MOVIE_NUMBER_RANGES = {
+    'year': (1900, 2024), 'runtime': (80, 240), 'genre_count': (1, 3),
+    'writer_count': (1, 3), 'cast_count': (1, 8), 'released_year': (1900, 2024),
+    'released_month': (1, 12), 'released_day': (1, 28), 'imdb_rating': (1, 10),
+    'imdb_votes': (1000, 2000000), 'imdb_id': (100000, 10000000), 'viewer_rating': (1, 10),
+    'viewer_reviews': (100, 10000), 'wins': (0, 20), 'nominations': (0, 50), 'metacritic': (0, 100),
+}
+
+
+def _shape(value):
+    """Types of a document's values, recursively"""
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shape(value[0])] if value else []
+    return type(value)
+
+
+def test_numpy_numeric_rows_match_the_per_document_draws():
+    pytest.importorskip('numpy')
+    vectorised = list(MovieFactory.numeric_rows(2000))
+    per_document = [MovieFactory._random_numbers() for _ in range(2000)]
+
+    assert len(vectorised) == 2000
+    assert set(vectorised[0]) == set(per_document[0])
+    for rows in (vectorised, per_document):
+        for name, (low, high) in _MOVIE_NUMBER_RANGES.items():
+            assert all(low <= row[name] <= high for row in rows), name
+        assert {row['rated'] for row in rows} <= set(MovieFactory.RATINGS)
+        assert {row['language'] for row in rows} <= set(MovieFactory.LANGUAGES)
+        assert {row['country'] for row in rows} <= set(MovieFactory.COUNTRIES)
+    for name in per_document[0]:
+        assert {type(row[name]) for row in vectorised} == {type(row[name]) for row in per_document}, name
+
+    # Documents streamed through the NumPy path look like individually built ones
+    assert mongo_factories.np is not None
+    assert all(_shape(doc) == _shape(MovieFactory.create()) for doc in MovieFactory.create_iter(20))
+
+
+def test_create_batch_parallel_shards_across_processes():
+    docs = MovieFactory.create_batch_parallel(7, workers=3, seed=42, type='series')
+
+    assert len(docs) == 7
+    assert len({doc['_id'] for doc in docs}) == 7
+    assert {doc['type'] for doc in docs} == {'series'}
+
+    # Each shard reseeds from the base seed, so the same seed reproduces the values
+    again = MovieFactory.create_batch_parallel(7, workers=3, seed=42, type='series')
+    assert [doc['title'] for doc in again] == [doc['title'] for doc in docs]
+
+
+def test_create_batch_parallel_of_nothing_starts_no_pool(monkeypatch):
+    monkeypatch.setattr(mongo_factories, '_PROCESS_POOLS', {})
+
+    assert MovieFactory.create_batch_parallel(0, workers=2) == []
+    assert mongo_factories._PROCESS_POOLS == {}
+
+
+class _BrokenPool:
+    shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+def test_create_batch_parallel_discards_a_broken_pool(monkeypatch):
+    broken = _BrokenPool()
+    monkeypatch.setattr(mongo_factories, '_PROCESS_POOLS', {2: broken})
+
+    with pytest.raises(BrokenProcessPool):
+        MovieFactory.create_batch_parallel(4, workers=2)
+    assert 2 not in mongo_factories._PROCESS_POOLS
+    assert broken.shut_down
@@ -0,0 +1,125 @@
+"""MongoDBAdapter tests against mongomock"""
+
+import pytest
+
+mongomock = pytest.importorskip('mongomock')
+
+from governance import data_adapter
+from governance.data_adapter import MongoDBAdapter, MASK_MARKER_FIELD
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.setattr('pymongo.MongoClient', mongomock.MongoClient)
+    monkeypatch.setattr(data_adapter, '_CLIENT_CACHE', {})
+    adapter = MongoDBAdapter()
+    adapter.connect('mongodb://localhost/testdb')
+    return adapter
+
+
+def _mask(value):
+    return value[0] + '***'
+
+
+def test_mask_field_masks_every_document_without_writing_a_marker(adapter):
+    adapter.db.users.insert_many([{'email': 'alice@x'}, {'email': 'bob@x'}, {'name': 'no email'}])
+
+    assert adapter.mask_field('users', 'email', _mask) == 2
+
+    docs = list(adapter.db.users.find({'email': {'$exists': True}}))
+    assert sorted(doc['email'] for doc in docs) == ['a***', 'b***']
+    assert all(MASK_MARKER_FIELD not in doc for doc in docs)
+
+
+def test_mask_field_remasks_rewritten_values_by_default(adapter):
+    adapter.db.users.insert_one({'_id': 1, 'email': 'alice@x'})
+    adapter.mask_field('users', 'email', _mask)
+    adapter.db.users.update_one({'_id': 1}, {'$set': {'email': 'carol@x'}})
+
+    assert adapter.mask_field('users', 'email', _mask) == 1
+    assert adapter.db.users.find_one({'_id': 1})['email'] == 'c***'
+
+
+def test_mask_field_marker_is_opt_in_and_skips_marked_documents(adapter):
+    adapter.db.users.insert_one({'_id': 1, 'email': 'alice@x'})
+
+    assert adapter.mask_field('users', 'email', _mask, marker_field=MASK_MARKER_FIELD) == 1
+    assert adapter.db.users.find_one({'_id': 1})[MASK_MARKER_FIELD] == ['email']
+    assert adapter.mask_field('users', 'email', _mask, marker_field=MASK_MARKER_FIELD) == 0
+
+
+def test_mask_field_writes_through_update_many_bulk(adapter, monkeypatch):
+    adapter.db.users.insert_many([{'email': f'user{i}@x'} for i in range(5)])
+    batches = []
+    original = adapter.update_many_bulk
+
+    def recording_update_many_bulk(collection, pairs):
+        pairs = list(pairs)
+        batches.append(pairs)
+        return original(collection, pairs)
+
+    monkeypatch.setattr(adapter, 'update_many_bulk', recording_update_many_bulk)
+
+    assert adapter.mask_field('users', 'email', _mask) == 5
+    assert len(batches) == 1 and len(batches[0]) == 5
+
+
+def test_update_many_bulk_splits_into_bulk_batches(adapter, monkeypatch):
+    monkeypatch.setattr(data_adapter, 'BULK_BATCH_SIZE', 2)
+    adapter.db.items.insert_many([{'_id': i, 'n': 0} for i in range(5)])
+    calls = []
+    bulk_write = mongomock.collection.Collection.bulk_write
+
+    def counting_bulk_write(self, requests, **kwargs):
+        calls.append(len(requests))
+        return bulk_write(self, requests, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, 'bulk_write', counting_bulk_write)
+
+    pairs = [({'_id': i}, {'n': i}) for i in range(5)] + [({'_id': 0}, {'$inc': {'n': 10}})]
+    assert adapter.update_many_bulk('items', pairs) == 5
+    assert calls == [2, 2, 2]
+    assert [doc['n'] for doc in adapter.db.items.find(sort=[('_id', 1)])] == [10, 1, 2, 3, 4]
+
+
+def test_writes_invalidate_cached_collection_stats(adapter, monkeypatch):
+    counts = iter([1, 3])
+
+    def fake_aggregate(self, pipeline, *args, **kwargs):
+        return [{'storageStats': {'count': next(counts), 'size': 300, 'nindexes': 1}}]
+
+    monkeypatch.setattr(mongomock.collection.Collection, 'aggregate', fake_aggregate)
+
+    assert adapter.get_collection_stats('items')['count'] == 1
+    assert adapter.get_collection_stats('items')['count'] == 1  # served from cache
+    adapter.insert_documents('items', [{'n': 1}, {'n': 2}])
+    assert adapter.get_collection_stats('items')['count'] == 3
+
+
+def test_collection_stats_survive_a_concurrent_invalidation(adapter, monkeypatch):
+    class _EvictedCache(dict):
+        # A concurrent write's _invalidate lands right after every store
+        def __setitem__(self, key, value):
+            pass
+
+    adapter._stats_cache = _EvictedCache()
+    monkeypatch.setattr(adapter, '_fetch_stats', lambda names: {name: {'count': 7} for name in names})
+
+    assert adapter.get_collection_stats('items') == {'count': 7}
+
+
+def test_find_by_ids_queries_one_chunk_at_a_time(adapter, monkeypatch):
+    monkeypatch.setattr(data_adapter, 'FIND_BY_IDS_CHUNK_SIZE', 2)
+    adapter.db.items.insert_many([{'_id': i} for i in range(5)])
+    queried = []
+    find = mongomock.collection.Collection.find
+
+    def recording_find(self, filter=None, *args, **kwargs):
+        queried.append(filter['_id']['$in'])
+        return find(self, filter, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, 'find', recording_find)
+
+    found = adapter.find_by_ids('items', (i for i in [0, 1, 2, 3, 4, 99]))
+    assert queried == [[0, 1], [2, 3], [4, 99]]
+    assert sorted(found) == [0, 1, 2, 3, 4]
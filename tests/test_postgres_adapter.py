@@ -0,0 +1,149 @@
+"""PostgreSQLAdapter tests against a fake psycopg2 connection (no server needed)"""
+
+import csv
+import json
+from datetime import datetime
+
+import pytest
+
+psycopg2 = pytest.importorskip('psycopg2')
+from psycopg2 import extras, sql
+
+from bson import ObjectId
+from governance.data_adapter import PostgreSQLAdapter, PG_COPY_THRESHOLD
+
+
+class FakeCursor:
+    def __init__(self):
+        self.copied = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, *args):
+        pass
+
+    def copy_expert(self, statement, buffer):
+        self.copied = buffer.getvalue()
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_obj
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.checked_out = 0
+        self.checkouts = 0
+
+    def getconn(self):
+        self.checked_out += 1
+        self.checkouts += 1
+        return self.connection
+
+    def putconn(self, connection):
+        self.checked_out -= 1
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    # Rendering identifiers needs a live connection; the statement text isn't under test
+    monkeypatch.setattr(sql.Composed, 'as_string', lambda self, context: 'statement')
+    adapter = PostgreSQLAdapter()
+    adapter.pool = FakePool()
+    return adapter
+
+
+def _document():
+    return {
+        'id': 1,
+        'name': 'alice',
+        'profile': {'created_at': datetime(2024, 1, 2, 3, 4, 5), 'ref': ObjectId('0' * 24)},
+    }
+
+
+def _insert_small(adapter, monkeypatch, documents):
+    """Insert via execute_values and return the JSON text sent for the profile column"""
+    captured = {}
+
+    def fake_execute_values(cursor, statement, rows, page_size):
+        captured['rows'] = rows
+
+    monkeypatch.setattr(extras, 'execute_values', fake_execute_values)
+    assert adapter.insert_documents('people', documents) == len(documents)
+    wrapped = captured['rows'][0][2]
+    return wrapped.dumps(wrapped.adapted)
+
+
+def _insert_copy(adapter, documents):
+    """Insert via COPY and return the CSV text sent for the profile column"""
+    assert adapter.insert_documents('people', documents) == len(documents)
+    row = next(csv.reader(adapter.pool.connection.cursor_obj.copied.splitlines()))
+    return row[2]
+
+
+def test_nested_values_serialise_the_same_below_and_above_copy_threshold(adapter, monkeypatch):
+    small = _insert_small(adapter, monkeypatch, [_document()])
+    large = _insert_copy(adapter, [_document() for _ in range(PG_COPY_THRESHOLD)])
+
+    assert small == large
+    assert json.loads(small) == {'created_at': '2024-01-02 03:04:05', 'ref': '0' * 24}
+    assert adapter.pool.connection.committed
+
+
+def test_top_level_object_ids_are_sent_as_text_below_and_above_copy_threshold(adapter, monkeypatch):
+    oid = ObjectId()
+    captured = {}
+    monkeypatch.setattr(extras, 'execute_values',
+                        lambda cursor, statement, rows, page_size: captured.update(rows=rows))
+
+    adapter.insert_documents('people', [{'_id': oid, 'name': 'alice'}])
+    adapter.insert_documents('people', [{'_id': oid, 'name': 'alice'}] * PG_COPY_THRESHOLD)
+
+    copied = next(csv.reader(adapter.pool.connection.cursor_obj.copied.splitlines()))
+    assert captured['rows'][0] == (str(oid), 'alice')
+    assert copied == [str(oid), 'alice']
+    # psycopg2 raises "can't adapt type" for values it doesn't know
+    psycopg2.extensions.adapt(captured['rows'][0][0])
+
+
+def test_each_operation_checks_a_connection_out_and_back(adapter, monkeypatch):
+    monkeypatch.setattr(extras, 'execute_values', lambda *args, **kwargs: None)
+
+    adapter.insert_documents('people', [_document()])
+    adapter.insert_documents('people', [_document()])
+
+    assert adapter.pool.checkouts == 2
+    assert adapter.pool.checked_out == 0
+
+
+def test_failed_operation_rolls_back_and_releases_the_connection(adapter, monkeypatch):
+    def failing_execute_values(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(extras, 'execute_values', failing_execute_values)
+
+    with pytest.raises(RuntimeError):
+        adapter.insert_documents('people', [_document()])
+    assert adapter.pool.connection.rolled_back
+    assert not adapter.pool.connection.committed
+    assert adapter.pool.checked_out == 0
@@ -0,0 +1,68 @@
+"""The mimesis provider backend of the MongoDB data factories"""
+
+import inspect
+import re
+from pathlib import Path
+
+import pytest
+import yaml
+
+pytest.importorskip('mimesis')
+
+import mongo_factories
+from _providers import FakerProviders, MimesisProviders, make_providers
+from mongo_factories import UserFactory
+
+USERS_SPEC = Path(mongo_factories.__file__).parent / 'data_definitions' / 'mongodb' / 'users.yaml'
+
+
+def _provider_methods(cls):
+    return {name for name, _ in inspect.getmembers(cls, inspect.isfunction) if not name.startswith('_')}
+
+
+def _field(doc, path):
+    for key in path.split('.'):
+        doc = doc[key]
+    return doc
+
+
+@pytest.fixture
+def mimesis_providers(monkeypatch):
+    # The main thread builds with the module-level providers and the shared value pools
+    monkeypatch.setattr(mongo_factories, 'providers', make_providers(seed=7))
+    mongo_factories.refresh_pools()
+    yield mongo_factories.providers
+    mongo_factories.refresh_pools()
+
+
+def test_make_providers_prefers_mimesis_with_the_faker_interface():
+    providers = make_providers(seed=1)
+
+    assert isinstance(providers, MimesisProviders)
+    assert _provider_methods(MimesisProviders) == _provider_methods(FakerProviders)
+    for name in _provider_methods(FakerProviders):
+        args = inspect.signature(getattr(FakerProviders, name)).parameters
+        value = getattr(providers, name)(*[5 for _ in list(args)[1:]])
+        assert isinstance(value, str) and value, name
+    assert len(providers.text(40)) <= 40
+
+
+def test_seeded_mimesis_providers_repeat_their_values():
+    first, second = make_providers(seed=3), make_providers(seed=3)
+
+    assert [first.username() for _ in range(5)] == [second.username() for _ in range(5)]
+
+
+def test_users_built_with_mimesis_pass_the_spec_validation_rules(mimesis_providers):
+    assert isinstance(mimesis_providers, MimesisProviders)
+    with open(USERS_SPEC) as f:
+        rules = yaml.safe_load(f)['spec']['validation']
+
+    for doc in UserFactory.create_batch(200):
+        for rule in rules:
+            value = _field(doc, rule['field'])
+            assert isinstance(value, {'string': str, 'array': list}[rule['type']]), rule['field']
+            if 'pattern' in rule:
+                assert re.match(rule['pattern'], value), (rule['field'], value)
+            assert rule.get('min_length', 0) <= len(value) <= rule.get('max_length', len(value))
+            assert rule.get('min_cardinality', 0) <= len(value) <= rule.get('max_cardinality', len(value))